@@ -0,0 +1,39 @@
+"""add webhooks events gin index
+
+Revision ID: 7c3e5a91d2f4
+Revises: 2b1349ddb356
+Create Date: 2026-10-17 10:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e5a91d2f4'
+down_revision: Union[str, None] = '2b1349ddb356'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('webhooks_events_idx'),
+            'webhooks',
+            ['events'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('webhooks_events_idx'),
+            table_name='webhooks',
+            postgresql_concurrently=True,
+        )
@@ -67,6 +67,8 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 300  # seconds, keep below the server-side idle timeout
+    DB_POOL_PRE_PING: bool = True
 
     # === Auth (SECRET_KEY for JWT/Session/Admin) ===
     SECRET_KEY: str = "change-me-in-production-use-openssl-rand-hex-32"
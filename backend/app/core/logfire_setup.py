@@ -4,15 +4,22 @@ import logfire
 
 from app.core.config import settings
 
+# The lifespan runs again for every TestClient and on reload; only the first call configures Logfire
+_configured = False
+
 
 def setup_logfire() -> None:
-    """Configure Logfire instrumentation."""
+    """Configure Logfire instrumentation. Subsequent calls are no-ops."""
+    global _configured
+    if _configured:
+        return
     logfire.configure(
         token=settings.LOGFIRE_TOKEN,
         service_name=settings.LOGFIRE_SERVICE_NAME,
         environment=settings.LOGFIRE_ENVIRONMENT,
         send_to_logfire="if-token-present",
     )
+    _configured = True
 
 
 def instrument_app(app):
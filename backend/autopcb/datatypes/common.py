@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 import math
-from typing import Optional
+from typing import Iterable, Optional
 
 from autopcb.datatypes.fields import positional
+from autopcb.sexpr import InterleavedOrderItem
 from autopcb.datatypes.mixins import DataclassSerializerMixin
 
+# Absolute tolerance (in mm) for comparing bounding boxes
+_BBOX_ABS_TOL = 1e-9
 
-@dataclass
+
+@dataclass(slots=True)
 class Margins:
     left: float = positional()
     top: float = positional()
@@ -14,8 +18,8 @@ class Margins:
     bottom: float = positional()
 
 
-@dataclass
-class Vector2D:
+@dataclass(slots=True)
+class Vector2D(InterleavedOrderItem):
     x: float = positional()
     y: float = positional()
 
@@ -84,7 +88,7 @@ class Vector2D:
         return rooted_distance
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector2DWithRotation:
     x: float = positional()
     y: float = positional()
@@ -127,7 +131,7 @@ class Vector2DWithRotation:
         self.rot = self.rot + angle
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox(DataclassSerializerMixin):
     """Represents a bounding box.
 
@@ -159,37 +163,35 @@ class BoundingBox(DataclassSerializerMixin):
 
     def rotate(self, rotation: float = 0, rotation_center: Vector2D | None = None):
         """Rotates the bounding box by an angle over its center or specified rotation point"""
-
+        rotation_radians = math.radians(rotation)
+        return self.rotate_precomputed(math.cos(rotation_radians), math.sin(rotation_radians), rotation_center)
+
+    def rotate_precomputed(self, cos_r: float, sin_r: float, rotation_center: Vector2D | None = None):
+        """Same as rotate(), but takes the cosine and sine of the rotation angle,
+        so rotating many boxes by the same angle only computes them once"""
+        half_width = self.width / 2
+        half_height = self.height / 2
+        center_x = self.x + half_width
+        center_y = self.y + half_height
+
+        # Same convention as Vector2D.rotate, which rotates by the negated angle
+        s, c = -sin_r, cos_r
+
+        # The envelope of a rotated rectangle is centered on its rotated center, with half extents given by
+        # projecting the half diagonals on the axes, so there's no need to rotate the four corners one by one
         if rotation_center is not None:
-            rotation_point = rotation_center
-        else:
-            center_x = self.x + self.width / 2
-            center_y = self.y + self.height / 2
-            rotation_point = Vector2D(center_x, center_y)
-
-        corners = [
-            Vector2D(self.x, self.y),
-            Vector2D(self.x + self.width, self.y),
-            Vector2D(self.x, self.y + self.height),
-            Vector2D(self.x + self.width, self.y + self.height),
-        ]
-
-        for index, corner in enumerate(corners):
-            corners[index].rotate(rotation_point, rotation)
-
-        min_x = min(point.x for point in corners)
-        min_y = min(point.y for point in corners)
-        max_x = max(point.x for point in corners)
-        max_y = max(point.y for point in corners)
-
-        new_width = max_x - min_x
-        new_height = max_y - min_y
+            dx = center_x - rotation_center.x
+            dy = center_y - rotation_center.y
+            center_x = dx * c - dy * s + rotation_center.x
+            center_y = dx * s + dy * c + rotation_center.y
+        new_half_width = abs(half_width * c) + abs(half_height * s)
+        new_half_height = abs(half_width * s) + abs(half_height * c)
 
         return BoundingBox(
-            min_x,
-            min_y,
-            new_width,
-            new_height,
+            center_x - new_half_width,
+            center_y - new_half_height,
+            new_half_width * 2,
+            new_half_height * 2,
         )
 
     def overlaps(self, other: 'BoundingBox', margin: float = 0) -> bool:
@@ -229,6 +231,44 @@ class BoundingBox(DataclassSerializerMixin):
             max_y - min_y,
         )
 
+    @staticmethod
+    def union(bounding_boxes: Iterable['BoundingBox'], default: Optional['BoundingBox'] = None) -> 'BoundingBox':
+        """Computes the aggregated bounding box that encompasses all the bounding boxes in a single pass.
+
+        Same result as sum(), but without an intermediate BoundingBox per item, and always a new object
+        (sum() of a single bounding box returns that same bounding box). If there are no bounding boxes,
+        returns a copy of default, or raises ValueError if no default is given."""
+        iterator = iter(bounding_boxes)
+        first = next(iterator, None)
+        if first is None:
+            if default is None:
+                raise ValueError('BoundingBox.union() requires at least one bounding box or a default')
+            return BoundingBox(default.x, default.y, default.width, default.height)
+        min_x = first.x
+        min_y = first.y
+        max_x = first.x + first.width
+        max_y = first.y + first.height
+        for bbox in iterator:
+            x = bbox.x
+            y = bbox.y
+            if x < min_x:
+                min_x = x
+            if y < min_y:
+                min_y = y
+            x += bbox.width
+            y += bbox.height
+            if x > max_x:
+                max_x = x
+            if y > max_y:
+                max_y = y
+
+        return BoundingBox(
+            min_x,
+            min_y,
+            max_x - min_x,
+            max_y - min_y,
+        )
+
     def __radd__(self, other):
         """Right-hand addition for sum() compatibility."""
         if other == 0:
@@ -236,8 +276,14 @@ class BoundingBox(DataclassSerializerMixin):
         return self.__add__(other)
 
     def __eq__(self, other: 'BoundingBox') -> bool:
-        # Use math.isclose because floating point errors accumulate somewhere
-        return math.isclose(self.x, other.x) and math.isclose(self.y, other.y) and math.isclose(self.height, other.height) and math.isclose(self.width, other.width)
+        # Use math.isclose because floating point errors accumulate somewhere. A relative tolerance alone fails
+        # near 0 (e.g. 5.9e-17 vs 0.0 after a 90 degree rotation), so also allow an absolute one far below KiCad's 1 nm
+        return (
+            math.isclose(self.x, other.x, abs_tol=_BBOX_ABS_TOL)
+            and math.isclose(self.y, other.y, abs_tol=_BBOX_ABS_TOL)
+            and math.isclose(self.height, other.height, abs_tol=_BBOX_ABS_TOL)
+            and math.isclose(self.width, other.width, abs_tol=_BBOX_ABS_TOL)
+        )
 
 
 
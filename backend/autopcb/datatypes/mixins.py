@@ -1,14 +1,122 @@
 from dataclasses import fields, is_dataclass
-import json
 import re
 import dacite
+import orjson
 from pathlib import Path
+from typing import Any, Callable
 from typing_extensions import Self
 from autopcb.sexpr import parse_dataclass, parse_sexp, serialize_dataclass, to_sexp
 
 
+# Built once and shared by every from_dict call instead of constructing a default Config per call.
+# Type checks stay on, they are the only validation primitive values from API payloads get
+_DACITE_CONFIG = dacite.Config()
+
+# Field names included by asdict(), resolved once per dataclass type
+_REPR_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _repr_field_names(cls: type) -> tuple[str, ...]:
+    names = _REPR_FIELDS_CACHE.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.repr is True)
+        _REPR_FIELDS_CACHE[cls] = names
+    return names
+
+
+# Values of these exact types serialize to themselves, so callers skip the _serialize call for them
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Generated asdict() function per dataclass type, see _build_asdict_impl
+_ASDICT_IMPL_CACHE: dict[type, Callable[[Any], dict]] = {}
+
+
+def _compile_asdict_impl(cls: type, items: list[str], namespace: dict) -> Callable[[Any], dict]:
+    """Compiles ``{item, ...}`` into a function of ``o``. An instance with an unset field (such as an
+    ``init=False`` field without a default) raises AttributeError there, and goes to ``namespace['_fallback']``,
+    which leaves that field out like the hasattr() guard in the generic path."""
+    source = (
+        "def _asdict_impl(o):\n"
+        "    try:\n"
+        f"        return {{{', '.join(items)}}}\n"
+        "    except AttributeError:\n"
+        "        return _fallback(o)\n"
+    )
+    exec(compile(source, f"<asdict {cls.__qualname__}>", "exec"), namespace)
+    return namespace['_asdict_impl']
+
+
+def _asdict_set_fields(obj) -> dict:
+    return {name: _serialize(getattr(obj, name)) for name in _repr_field_names(type(obj)) if hasattr(obj, name)}
+
+
+def _build_asdict_impl(cls: type) -> Callable[[Any], dict]:
+    """Generates a straight-line ``{'field': o.field, ...}`` function for the dataclass type, so nested
+    trees don't pay the is_dataclass/isinstance dispatch for every primitive field. Whether a value is
+    copied as-is is decided by its runtime type, not by the field's annotation."""
+    items = [
+        f"{name!r}: (v if type(v := o.{name}) in _ATOMIC_TYPES else _serialize(v))"
+        for name in _repr_field_names(cls)
+    ]
+    impl = _compile_asdict_impl(cls, items, {
+        '_serialize': _serialize, '_ATOMIC_TYPES': _ATOMIC_TYPES, '_fallback': _asdict_set_fields,
+    })
+    _ASDICT_IMPL_CACHE[cls] = impl
+    return impl
+
+
+# Generated one-level ``{'field': o.field, ...}`` function per dataclass type, used by dumps()
+_SHALLOW_ASDICT_IMPL_CACHE: dict[type, Callable[[Any], dict]] = {}
+
+
+def _shallow_asdict_set_fields(obj) -> dict:
+    return {name: getattr(obj, name) for name in _repr_field_names(type(obj)) if hasattr(obj, name)}
+
+
+def _json_default(obj):
+    """orjson ``default`` hook for dumps(). Dataclasses are expanded one level at a time, so orjson walks the tree
+    and encodes it in a single pass without an intermediate asdict() copy of the whole tree."""
+    impl = _SHALLOW_ASDICT_IMPL_CACHE.get(type(obj))
+    if impl is None:
+        if isinstance(obj, set):
+            return list(obj)
+        if not is_dataclass(obj) or isinstance(obj, type):
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        cls = type(obj)
+        impl = _compile_asdict_impl(
+            cls, [f"{name!r}: o.{name}" for name in _repr_field_names(cls)], {'_fallback': _shallow_asdict_set_fields}
+        )
+        _SHALLOW_ASDICT_IMPL_CACHE[cls] = impl
+    return impl(obj)
+
+
+def _serialize(obj):
+    impl = _ASDICT_IMPL_CACHE.get(type(obj))
+    if impl is not None:
+        return impl(obj)
+    if type(obj) in _ATOMIC_TYPES:
+        return obj
+
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _build_asdict_impl(type(obj))(obj)
+    elif isinstance(obj, set):
+        return list(obj)
+    elif isinstance(obj, (list, tuple)):
+        return [v if type(v) in _ATOMIC_TYPES else _serialize(v) for v in obj]
+    elif isinstance(obj, dict):
+        return {_serialize(k): _serialize(v) for k, v in obj.items()}
+    else:
+        return obj
+
+
 class DataclassSerializerMixin:
-    """Mixin class for dataclass parsing and serialization."""
+    """Mixin class for dataclass parsing and serialization.
+
+    The mixin declares empty ``__slots__``, so subclasses declared with ``@dataclass(slots=True)`` don't carry a
+    per-instance ``__dict__``. Leave slots off for classes that look up their attributes through ``__dict__``.
+    """
+
+    __slots__ = ()
 
     @classmethod
     def from_dict(cls, data: dict) -> Self:
@@ -16,6 +124,7 @@ class DataclassSerializerMixin:
         return dacite.from_dict(
             data_class=cls,
             data=data,
+            config=_DACITE_CONFIG,
         )
 
     @classmethod
@@ -23,39 +132,35 @@ class DataclassSerializerMixin:
         """
         Instantiates the class from a JSON string using dacite, treating uuid.UUID and str as equivalent types.
         """
-        return cls.from_dict(json.loads(json_string))
+        return cls.from_dict(orjson.loads(json_string))
 
     def asdict(self):
         """Serialize the class as a dictionary."""
-        def serialize(obj):
-            if is_dataclass(obj):
-                return {
-                    f.name: serialize(getattr(obj, f.name))
-                    for f in fields(obj)
-                    if hasattr(obj, f.name) and f.repr is True
-                }
-            elif isinstance(obj, set):
-                return list(obj)
-            elif isinstance(obj, (list, tuple)):
-                return [serialize(v) for v in obj]
-            elif isinstance(obj, dict):
-                return {serialize(k): serialize(v) for k, v in obj.items()}
-            else:
-                return obj
-
-        return serialize(self)
+        return _serialize(self)
 
     def dumps(self):
-        """Dumps object into JSON"""
-        return json.dumps(self.asdict())
+        """Dumps object into JSON.
+
+        The output is orjson's compact form: no spaces after separators, non-ASCII characters written as UTF-8
+        rather than escaped, and NaN/Infinity written as null. json.loads()/from_json() read it back the same way,
+        except that NaN/Infinity come back as None.
+        """
+        return orjson.dumps(
+            self,
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+        ).decode()
 
 
 class SexprMixin:
     """Mixin class for converting between S-expressions and dataclasses."""
+
+    __slots__ = ()
   
     @classmethod
     def from_file(cls, file_path: str) -> Self:
-        sexp_list = parse_sexp(Path(file_path).read_text())
+        # KiCad files are always UTF-8, decode explicitly rather than through the locale-dependent read_text()
+        sexp_list = parse_sexp(Path(file_path).read_bytes().decode('utf-8'))
         return cls.from_sexpr(sexp_list)
 
     @classmethod
@@ -1,37 +1,43 @@
 from dataclasses import dataclass, field
-from itertools import chain
 import itertools
-from typing import Iterable, List, Optional, Set, Union, Dict, Tuple
+import math
+from typing import ClassVar, Iterable, List, Optional, Set, Union, Dict, Tuple
 from uuid import uuid4
 
 from autopcb.datatypes.common import Margins, BoundingBox, Vector2D, Vector2DWithRotation
 from autopcb.datatypes.fields import flag_boolean, positional
 from autopcb.datatypes.utils import get_arc_bounding_box, normalize_angle
+from autopcb.sexpr import InterleavedOrderItem
 from autopcb.datatypes.mixins import DataclassSerializerMixin, SexprMixin
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vector3D:
     x: float = positional()                                                                     
     y: float = positional()
     z: float = positional()
 
 
-@dataclass(kw_only=True)
-class Arc:
+@dataclass(kw_only=True, slots=True)
+class Arc(InterleavedOrderItem):
     start: Vector2D
     mid: Optional[Vector2D]
     end: Vector2D
+    _arc_bounding_box: Optional[Tuple[tuple, BoundingBox]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def arc_bounding_box(self) -> BoundingBox:
+        return get_cached_arc_bounding_box(self)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ShapeLineChain:
     xys: List[Vector2D]
     arcs: List[Arc]
-    _preserve_interleaved_order: List[str] = field(default_factory=lambda: ['xys', 'arcs'])
+    _preserve_interleaved_order: ClassVar[Tuple[str, ...]] = ('xys', 'arcs')
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Layer:
     index: int = positional()
     name: str = positional()
@@ -44,7 +50,7 @@ class Layer:
     _index_from_0 = True
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PageInfo:
     type: str = positional()
     width: Optional[float]
@@ -52,12 +58,12 @@ class PageInfo:
     portrait: bool = flag_boolean()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TitleBlockComment:
     index: int
     text: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TitleBlock:
     title: Optional[str]
     date: Optional[str]
@@ -66,13 +72,13 @@ class TitleBlock:
     comments: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BoardStackupItemThickness:
     thickness: float = positional()
     locked: bool = flag_boolean()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BoardStackupItem:
     layer: Optional[str] = positional()
     type: str
@@ -84,7 +90,7 @@ class BoardStackupItem:
     sublayers: List['BoardStackupItem']
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BoardStackup:
     # We need the _ because the parser will try to do 2 things:
     # since it's a list, the last char will be removed when matching the sexpression 0th element items
@@ -97,13 +103,13 @@ class BoardStackup:
     edge_plating: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class General:
     thickness: Optional[float]
     legacy_teardrops: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DimensionDefaults:
     size: Optional[Vector2D]
     thickness: Optional[float]
@@ -111,7 +117,7 @@ class DimensionDefaults:
     keep_upright: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Defaults:
     edge_clearance: Optional[float]
     copper_line_width: Optional[float]
@@ -128,7 +134,7 @@ class Defaults:
     dimension_precision: Optional[int]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TeardropParameters:
     # todo fixme I think most of these are wrong
     enabled: bool
@@ -142,18 +148,18 @@ class TeardropParameters:
     filter_ratio: Optional[float]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneLayerProperties:
     layer: int
     hatching_offset: Optional[Vector2D]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneDefaults:
     properties: List[ZoneLayerProperties]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PcbPlotParams:
     # selection masks (KiCad writes hex like 0x..., older files may write integers).
     # Keep as str to preserve exact representation round-trip.
@@ -213,7 +219,7 @@ class PcbPlotParams:
     outputdirectory: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Setup:
     stackup: Optional[BoardStackup]
     last_trace_width: Optional[float]
@@ -257,7 +263,7 @@ class Setup:
     zone_defaults: Optional[ZoneDefaults]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Font:
     face: Optional[str]
     size: Optional[Vector2D]
@@ -267,14 +273,14 @@ class Font:
     italic: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Effects:
     font: Optional[Font]
     justifies: List[str]
     hide: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Property:
     # the mounting hole file (in a library, not placed on a board) did not have some of these attributes
     name: str = positional()
@@ -287,13 +293,14 @@ class Property:
     effects: Optional[Effects]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Net:
+    _interned_fields = ('name',)
     number: int = positional()
     name: str = positional()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NetClass:
     name: str
     description: str
@@ -308,19 +315,19 @@ class NetClass:
     add_nets: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ListOfPoints:
     pts: List[ShapeLineChain]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RenderCache:
     text: str = positional()
     angle: float = positional()
     polygons: List[ListOfPoints]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Color:
     r: int = positional()  # 255
     g: int = positional()
@@ -328,14 +335,14 @@ class Color:
     a: float = positional()  # 0-1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Stroke:
     width: float
     type: str = "solid"  # solid, dash, dash_dot, dash_dot_dot, dot, default
     color: Optional[Color]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ReferenceImage:
     at: Vector2DWithRotation
     layer: Optional[str]
@@ -345,7 +352,7 @@ class ReferenceImage:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LayoutText:
     type: Optional[str]
     text: str
@@ -362,7 +369,7 @@ class LayoutText:
     uuid: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBox:
     locked: bool
     text: str
@@ -382,21 +389,21 @@ class TextBox:
     tstamp: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TableBorder:
     external: bool
     header: bool
     stroke: Optional[Stroke]
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSeparators:
     rows: bool
     cols: bool
     stroke: Optional[Stroke]
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     column_count: int
     locked: bool
@@ -408,7 +415,7 @@ class Table:
     separators: Optional[TableSeparators]
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionFormat:
     prefix: Optional[str]
     suffix: Optional[str]
@@ -419,7 +426,7 @@ class DimensionFormat:
     suppress_zeroes: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionStyle:
     thickness: Optional[float]
     arrow_length: Optional[float]
@@ -431,14 +438,14 @@ class DimensionStyle:
     text_frame: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class GrTextLayer:
     name: str = positional()
     knockout: bool = flag_boolean()
 
 
-@dataclass(kw_only=True)
-class GrText:
+@dataclass(kw_only=True, slots=True)
+class GrText(InterleavedOrderItem):
     text: str = positional()
     locked: Optional[bool]
     at: Vector2DWithRotation
@@ -450,8 +457,8 @@ class GrText:
     tstamp: Optional[str]
 
 
-@dataclass
-class Dimension:
+@dataclass(slots=True)
+class Dimension(InterleavedOrderItem):
     type: str
     # locked: bool # free locked token in v6 and v7 formats
     layer: Optional[str]
@@ -466,17 +473,17 @@ class Dimension:
     gr_text: Optional[GrText]
 
 
-@dataclass
+@dataclass(slots=True)
 class Offset2d:
     xy: Vector2D
 
 
-@dataclass
+@dataclass(slots=True)
 class Offset3d:
     xyz: Vector3D
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Drill:
     size_x: float = positional()
     size_y: Optional[float] = positional()  # if size_y is not set, it is = size_x (according to the kicad parser C++ source)
@@ -484,14 +491,14 @@ class Drill:
     offset: Optional[Offset2d]
 
 
-@dataclass
+@dataclass(slots=True)
 class PadOptions:
     clearance: Optional[str]
     anchor: Optional[str]
 
 
-@dataclass
-class GrArc:
+@dataclass(slots=True)
+class GrArc(InterleavedOrderItem):
     start: Optional[Vector2D]
     mid: Optional[Vector2D]
     end: Optional[Vector2D]
@@ -505,10 +512,15 @@ class GrArc:
     tstamp: Optional[str]
     status: Optional[int]
     net: Optional[int]
+    _arc_bounding_box: Optional[Tuple[tuple, BoundingBox]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def arc_bounding_box(self) -> BoundingBox:
+        return get_cached_arc_bounding_box(self)
 
 
-@dataclass
-class GrCircle:
+@dataclass(slots=True)
+class GrCircle(InterleavedOrderItem):
     center: Optional[Vector2D]
     end: Optional[Vector2D]
     stroke: Optional[Stroke]
@@ -523,8 +535,8 @@ class GrCircle:
     net: Optional[int]
 
 
-@dataclass
-class GrCurve:
+@dataclass(slots=True)
+class GrCurve(InterleavedOrderItem):
     pts: ShapeLineChain
     layer: Optional[str]
     layers: Optional[List[int]]
@@ -538,8 +550,8 @@ class GrCurve:
     stroke: Optional[Stroke]
 
 
-@dataclass
-class GrRect:
+@dataclass(slots=True)
+class GrRect(InterleavedOrderItem):
     start: Optional[Vector2D]
     end: Optional[Vector2D]
     stroke: Optional[Stroke]
@@ -554,8 +566,8 @@ class GrRect:
     net: Optional[int]
 
 
-@dataclass
-class GrBBox:
+@dataclass(slots=True)
+class GrBBox(InterleavedOrderItem):
     start: Optional[Vector2D]
     end: Optional[Vector2D]
     width: Optional[float]
@@ -571,8 +583,8 @@ class GrBBox:
     net: Optional[int]
     stroke: Optional[Stroke]
 
-@dataclass
-class GrLine:
+@dataclass(slots=True)
+class GrLine(InterleavedOrderItem):
     start: Optional[Vector2D]
     end: Optional[Vector2D]
     stroke: Optional[Stroke]
@@ -587,8 +599,8 @@ class GrLine:
     net: Optional[int]
 
 
-@dataclass
-class GrVector:
+@dataclass(slots=True)
+class GrVector(InterleavedOrderItem):
     start: Optional[Vector2D]
     end: Optional[Vector2D]
     layer: Optional[str]
@@ -603,8 +615,8 @@ class GrVector:
     stroke: Optional[Stroke]
 
 
-@dataclass
-class GrPoly:
+@dataclass(slots=True)
+class GrPoly(InterleavedOrderItem):
     pts: ShapeLineChain
     width: Optional[float]  # not sure why `.width` is here, but kicad adds it to kicad_pcb.footprint[108].pad[1].primitives.gr_poly[0].width when converting Altium files to kicad files
     stroke: Optional[Stroke]
@@ -619,8 +631,8 @@ class GrPoly:
     uuid: Optional[str]
 
 
-@dataclass
-class GrTextBox:
+@dataclass(slots=True)
+class GrTextBox(InterleavedOrderItem):
     text: str
     start: Optional[Vector2D]
     end: Optional[Vector2D]
@@ -638,7 +650,11 @@ class GrTextBox:
     tstamp: Optional[str]
 
 
-@dataclass
+# text items are left out of pad (custom primitives) bounding boxes
+_GR_EXCLUDED_FROM_BBOX = (GrText, GrTextBox)
+
+
+@dataclass(slots=True)
 class Primitives:
     gr_arcs: List[GrArc]
     gr_circles: List[GrCircle]
@@ -655,24 +671,30 @@ class Primitives:
     width: Optional[float]
     fill: Optional[bool]
 
+    # graphic item attributes, in declaration order
+    _GR_FIELDS = ('gr_arcs', 'gr_circles', 'gr_curves', 'gr_rects', 'gr_bboxes', 'gr_lines', 'gr_vectors', 'gr_polys', 'gr_texts', 'gr_text_boxes')
+
     @property
     def graphic_items(self):
-        return list(chain.from_iterable(item for name, item in self.__dict__.items() if name.startswith('gr_')))
+        items = []
+        for name in self._GR_FIELDS:
+            items.extend(getattr(self, name))
+        return items
 
     def __len__(self):
-        return len(self.graphic_items)
+        return sum(len(getattr(self, name)) for name in self._GR_FIELDS)
 
     def append(self, item, name):
         getattr(self, name).append(item)
 
 
-@dataclass
+@dataclass(slots=True)
 class ViaTenting:
     front: bool = flag_boolean()
     back: bool = flag_boolean()
 
 
-@dataclass
+@dataclass(slots=True)
 class PadstackLayer:
     shape: Optional[str]
     size: Optional[Vector2D]
@@ -691,14 +713,14 @@ class PadstackLayer:
     primitives: Primitives
 
 
-@dataclass
+@dataclass(slots=True)
 class Padstack:
     mode: str
     # todo fixme this should be converted to a List[...]
     layers: Dict[str, PadstackLayer]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneFill:
     yes: Optional[bool] = positional()
     mode: Optional[str]
@@ -718,7 +740,7 @@ class ZoneFill:
     island_area_min: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class ZonePlacement:
     enabled: bool
     sheetname: Optional[str]
@@ -726,7 +748,7 @@ class ZonePlacement:
     group: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneKeepout:
     # todo fixme: add support to the parser for typing this as 'allowed' | 'not_allowed'
     tracks: str
@@ -736,41 +758,41 @@ class ZoneKeepout:
     footprints: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneAttrType:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneAttr:
     teardrop: Optional[ZoneAttrType]
 
 
-@dataclass
+@dataclass(slots=True)
 class Island:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Polygon:
     layer: Optional[str]
     island: Optional[Island]
     ptss: List[ShapeLineChain]
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneHatch:
     type: str = positional()
     value: float = positional()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ZoneConnectPads:
     enable: Optional[bool] = positional()
     clearance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     net: Optional[int]
     net_name: Optional[str]
@@ -797,7 +819,7 @@ class Zone:
     locked: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model3D:
     filename: str = positional()
     at: Optional[Vector3D]
@@ -808,7 +830,7 @@ class Model3D:
     rotate: Optional[Offset3d]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Group:
     name: Optional[str] = positional()
     locked: Optional[bool]
@@ -817,7 +839,7 @@ class Group:
     memberss: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedFile:
     name: str
     type: Optional[str]
@@ -825,8 +847,8 @@ class EmbeddedFile:
     checksum: str
 
 
-@dataclass
-class FpArc:
+@dataclass(slots=True)
+class FpArc(InterleavedOrderItem):
     locked: Optional[bool]
     start: Optional[Vector2D]
     mid: Optional[Vector2D]
@@ -844,6 +866,12 @@ class FpArc:
     # todo fixme When we finish implementing the kicad file format upgrader
     #  remove the attribute angle and remove
     angle: Optional[float]
+    _arc_bounding_box: Optional[Tuple[tuple, BoundingBox]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def arc_bounding_box(self) -> BoundingBox:
+        return get_cached_arc_bounding_box(self)
+
     def __post_init__(self):
         if self.angle is not None:
             # if the old kicad format is used (self.angle is specified)
@@ -858,10 +886,15 @@ class FpArc:
             #     mid=the midpoint of the arc
             center = self.start
             arc_start = self.end
-            arc_end = Vector2D(arc_start.x, arc_start.y)
-            arc_end.rotate(center, -self.angle)
-            arc_mid = Vector2D(arc_start.x, arc_start.y)
-            arc_mid.rotate(center, -self.angle / 2)
+            # rotate arc_start around the center by -angle (end) and -angle / 2 (mid), like Vector2D.rotate,
+            # deriving the full angle's sin/cos from the half angle's so the trig is only evaluated once
+            half_angle = math.radians(self.angle) / 2
+            s_half, c_half = math.sin(half_angle), math.cos(half_angle)
+            s_full, c_full = 2 * s_half * c_half, c_half * c_half - s_half * s_half
+            dx = arc_start.x - center.x
+            dy = arc_start.y - center.y
+            arc_end = Vector2D(dx * c_full - dy * s_full + center.x, dx * s_full + dy * c_full + center.y)
+            arc_mid = Vector2D(dx * c_half - dy * s_half + center.x, dx * s_half + dy * c_half + center.y)
             self.start = arc_start
             self.mid = arc_mid
             self.end = arc_end
@@ -871,8 +904,8 @@ class FpArc:
             self.angle = None
 
 
-@dataclass
-class FpCircle:
+@dataclass(slots=True)
+class FpCircle(InterleavedOrderItem):
     locked: Optional[bool]
     center: Optional[Vector2D]
     end: Optional[Vector2D]
@@ -887,8 +920,8 @@ class FpCircle:
     net: Optional[int]
 
 
-@dataclass
-class FpCurve:
+@dataclass(slots=True)
+class FpCurve(InterleavedOrderItem):
     locked: Optional[bool]
     pts: ShapeLineChain
     solder_mask_margin: Optional[float]
@@ -902,8 +935,8 @@ class FpCurve:
     net: Optional[int]
 
 
-@dataclass
-class FpRect:
+@dataclass(slots=True)
+class FpRect(InterleavedOrderItem):
     locked: Optional[bool]
     start: Optional[Vector2D]
     end: Optional[Vector2D]
@@ -918,8 +951,8 @@ class FpRect:
     net: Optional[int]
 
 
-@dataclass
-class FpLine:
+@dataclass(slots=True)
+class FpLine(InterleavedOrderItem):
     locked: Optional[bool]
     start: Optional[Vector2D]
     end: Optional[Vector2D]
@@ -934,8 +967,8 @@ class FpLine:
     net: Optional[int]
 
 
-@dataclass
-class FpPoly:
+@dataclass(slots=True)
+class FpPoly(InterleavedOrderItem):
     locked: Optional[bool]
     pts: ShapeLineChain
     solder_mask_margin: Optional[float]
@@ -949,8 +982,8 @@ class FpPoly:
     net: Optional[int]
 
 
-@dataclass(kw_only=True)
-class FpText:
+@dataclass(kw_only=True, slots=True)
+class FpText(InterleavedOrderItem):
     type: str = positional()
     text: str = positional()
     locked: Optional[bool]
@@ -966,8 +999,8 @@ class FpText:
     tstamp: Optional[str]
 
 
-@dataclass(kw_only=True)
-class FpTextBox:
+@dataclass(kw_only=True, slots=True)
+class FpTextBox(InterleavedOrderItem):
     text: str = positional()
     locked: Optional[bool]
     start: Optional[Vector2D]
@@ -985,8 +1018,8 @@ class FpTextBox:
     knockout: Optional[bool]
 
 
-@dataclass
-class Track:
+@dataclass(slots=True)
+class Track(InterleavedOrderItem):
     #type: str = "segment"  # todo fixme what??
     start: Vector2D
     end: Vector2D
@@ -1001,8 +1034,8 @@ class Track:
     status: Optional[int]
 
 
-@dataclass
-class ArcTrack:
+@dataclass(slots=True)
+class ArcTrack(InterleavedOrderItem):
     locked: Optional[bool]
     start: Vector2D
     mid: Vector2D
@@ -1017,8 +1050,8 @@ class ArcTrack:
     status: Optional[int]
 
 
-@dataclass(kw_only=True)
-class Via:
+@dataclass(kw_only=True, slots=True)
+class Via(InterleavedOrderItem):
     blind: bool = flag_boolean()
     buried: bool = flag_boolean()
     micro: bool = flag_boolean()
@@ -1045,7 +1078,7 @@ class Via:
     free: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class Target:
     shape: str
     at: Vector2DWithRotation
@@ -1056,7 +1089,7 @@ class Target:
     uuid: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Generator:
     uuid: str
     type: str
@@ -1068,12 +1101,12 @@ class Generator:
     properties: Dict[str, Union[bool, float, str, Vector2D, ShapeLineChain]]
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerList:
     layer_infos: List[Layer]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Pad:
     _custom_pad_constituent_bboxes: List[BoundingBox] | None = None  # only used for visual debugging. |None so existing subcircuits created before this was added don't break
     _bounding_box: BoundingBox = field(default_factory=lambda: BoundingBox(0, 0, 0, 0))
@@ -1121,24 +1154,47 @@ class Pad:
     def compute_bounding_box(self):
         bounding_box = BoundingBox(0, 0, 0, 0)
         if self.shape == 'custom' and self.primitives is not None:
+            rotation_radians = math.radians(self.at.rot)
+            cos_r, sin_r = math.cos(rotation_radians), math.sin(rotation_radians)
             self._custom_pad_constituent_bboxes = [
-                get_element_bbox(element).rotate(self.at.rot).translate(self.at.x, self.at.y)
+                get_element_bbox(element).rotate_precomputed(cos_r, sin_r).translate(self.at.x, self.at.y)
                 for element in self.primitives.graphic_items
-                if not isinstance(element, GrText) and not isinstance(element, GrTextBox)
+                if not isinstance(element, _GR_EXCLUDED_FROM_BBOX)
             ]
-            self._bounding_box = sum(self._custom_pad_constituent_bboxes)
+            # a custom pad with only text primitives has no shape, so it gets an empty box at its position
+            self._bounding_box = BoundingBox.union(
+                self._custom_pad_constituent_bboxes, default=BoundingBox(self.at.x, self.at.y, 0, 0)
+            )
         else:
             bounding_box = BoundingBox(self.at.x - self.size.x / 2, self.at.y - self.size.y / 2, self.size.x, self.size.y)
-            self._custom_pad_constituent_bboxes = [bounding_box.rotate(self.at.rot, self.at)]
             self._bounding_box = bounding_box.rotate(self.at.rot, self.at)
+            self._custom_pad_constituent_bboxes = [self._bounding_box]
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedFiles:
     files: List[EmbeddedFile]
 
 
-@dataclass(kw_only=True)
+# Footprint attributes holding graphic items (footprint_items), in declaration order
+_FP_ITEM_FIELDS = ('fp_arcs', 'fp_circles', 'fp_curves', 'fp_rects', 'fp_lines', 'fp_polys', 'fp_texts', 'fp_text_boxes')
+# the text items are left out of the footprint's bounding box
+_FP_BBOX_ITEM_FIELDS = tuple(name for name in _FP_ITEM_FIELDS if name not in ('fp_texts', 'fp_text_boxes'))
+
+# footprint graphic item type -> the Footprint attribute holding items of that type
+_FP_ITEM_FIELD_BY_TYPE = {
+    FpText: 'fp_texts',
+    FpTextBox: 'fp_text_boxes',
+    FpLine: 'fp_lines',
+    FpRect: 'fp_rects',
+    FpCircle: 'fp_circles',
+    FpPoly: 'fp_polys',
+    FpCurve: 'fp_curves',
+    FpArc: 'fp_arcs',
+}
+
+
+@dataclass(kw_only=True, slots=True)
 class Footprint(DataclassSerializerMixin, SexprMixin):
     _custom_pad_constituent_bboxes: List[BoundingBox] | None = None  # this attribute is only for visual debugging. |None so existing subcircuits created before this was added don't break
     _all_bboxes: List[BoundingBox] | None = None  # this attribute is only for visual debugging. |None so existing subcircuits created before this was added don't break
@@ -1193,7 +1249,7 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
     embedded_fonts: Optional[bool]
     embedded_files: Optional[EmbeddedFiles]
     models: List[Model3D]
-    _preserve_interleaved_order: List[str] = field(default_factory=lambda: ['fp_arcs', 'fp_circles', 'fp_curves', 'fp_rects', 'fp_lines', 'fp_polys', 'fp_texts', 'fp_text_boxes'])
+    _preserve_interleaved_order: ClassVar[Tuple[str, ...]] = _FP_ITEM_FIELDS
 
     def __post_init__(self):
         """Initialize bounding box after dataclass initialization."""
@@ -1213,32 +1269,34 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
     def footprint_items(self):
         """Get the footprint items that are children of the footprint such as lines or arcs.
         The function to get the items that are children of board is a function of the board class"""
-        return list(chain.from_iterable(item for name, item in self.__dict__.items() if name.startswith('fp_')))
+        items = []
+        for name in _FP_ITEM_FIELDS:
+            items.extend(getattr(self, name))
+        return items
    
     def compute_bounding_box(self):
         """Compute the bounding box for the footprint based on its graphic items."""
-        fp_bboxes = [
-            get_element_bbox(element)
-            for element in self.footprint_items
-            if not isinstance(element, FpText) and not isinstance(element, FpTextBox)
-        ]
-        pad_bboxes = [element._bounding_box for element in self.pads]
-        all_bounding_boxes = fp_bboxes + pad_bboxes
-        aggregated_bbox = sum(all_bounding_boxes)
-        # only for debugging
-        self._all_bboxes = [bbox.translate(self.at.x, self.at.y).rotate(self.at.rot if self.at.rot is not None else 0, rotation_center=self.at)
-                            for bbox
-                            in fp_bboxes] + [bbox.translate(self.at.x, self.at.y).rotate(-self.at.rot if self.at.rot is not None else 0).rotate(self.at.rot if self.at.rot is not None else 0, rotation_center=self.at)
+        fp_bboxes = [get_element_bbox(element) for name in _FP_BBOX_ITEM_FIELDS for element in getattr(self, name)]
+        rotation_radians = math.radians(self.at.rot if self.at.rot is not None else 0)
+        cos_r, sin_r = math.cos(rotation_radians), math.sin(rotation_radians)
+        placed_pad_bboxes = [get_placed_pad_bbox(pad._bounding_box, self.at, cos_r, sin_r) for pad in self.pads]
+        # the footprint's bounding box is the union of these
+        self._all_bboxes = [bbox.translate(self.at.x, self.at.y).rotate_precomputed(cos_r, sin_r, rotation_center=self.at)
                             for bbox
-                            in pad_bboxes]
+                            in fp_bboxes] + placed_pad_bboxes
+        # only for debugging
         self._custom_pad_constituent_bboxes = []
-        for pad in self.pads:
-            for bbox in pad._custom_pad_constituent_bboxes:
-                self._custom_pad_constituent_bboxes.append(
-                    bbox.translate(self.at.x, self.at.y).rotate(-self.at.rot if self.at.rot is not None else 0).rotate(self.at.rot if self.at.rot is not None else 0, rotation_center=self.at)
+        for pad, placed_pad_bbox in zip(self.pads, placed_pad_bboxes, strict=True):
+            constituent_bboxes = pad._custom_pad_constituent_bboxes
+            if len(constituent_bboxes) == 1 and constituent_bboxes[0] is pad._bounding_box:
+                # a regular pad's only constituent is its own bounding box, which is already placed
+                self._custom_pad_constituent_bboxes.append(placed_pad_bbox)
+            else:
+                self._custom_pad_constituent_bboxes.extend(
+                    get_placed_pad_bbox(bbox, self.at, cos_r, sin_r) for bbox in constituent_bboxes
                 )
 
-        self._bounding_box = sum(self._all_bboxes)
+        self._bounding_box = BoundingBox.union(self._all_bboxes, default=BoundingBox(0, 0, 0, 0))
 
     def set_position(self, position: Vector2DWithRotation):
         """Set the position of the footprint and update its children's positions.
@@ -1249,12 +1307,25 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
         delta = position - self.at
         self.at = position
         for pad in self.pads:
-            pad.at.rot = normalize_angle(pad.at.rot + delta.rot)
-            pad.compute_bounding_box()
-
-        self.compute_bounding_box()
+            rot = normalize_angle(pad.at.rot + delta.rot)
+            # a pad's bounding box is relative to the footprint, so it only changes if the pad's rotation does
+            if rot != pad.at.rot:
+                pad.at.rot = rot
+                pad.compute_bounding_box()
+
+        if delta.rot == 0:
+            # A pure translation moves every placed bounding box by the same offset, so there's nothing to recompute
+            self._all_bboxes = [bbox.translate(delta.x, delta.y) for bbox in self._all_bboxes]
+            self._custom_pad_constituent_bboxes = [
+                bbox.translate(delta.x, delta.y) for bbox in self._custom_pad_constituent_bboxes
+            ]
+            self._bounding_box = self._bounding_box.translate(delta.x, delta.y)
+        else:
+            self.compute_bounding_box()
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Footprint):
             return self.uuid == other.uuid
         return False
@@ -1264,25 +1335,10 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
 
     def add_fp_item(self, fp_item: FpText | FpTextBox | FpLine | FpRect | FpCircle | FpPoly | FpCurve | FpArc):
         """Adds a footprint graphic item to the footprint."""
-        try:
-            if isinstance(fp_item, FpText):
-                self.fp_text.append(fp_item)
-            elif isinstance(fp_item, FpTextBox):
-                self.fp_text_box.append(fp_item)
-            elif isinstance(fp_item, FpLine):
-                self.fp_line.append(fp_item)
-            elif isinstance(fp_item, FpRect):
-                self.fp_rect.append(fp_item)
-            elif isinstance(fp_item, FpCircle):
-                self.fp_circle.append(fp_item)
-            elif isinstance(fp_item, FpPoly):
-                self.fp_poly.append(fp_item)
-            elif isinstance(fp_item, FpCurve):
-                self.fp_curve.append(fp_item)
-            elif isinstance(fp_item, FpArc):
-                self.fp_arc.append(fp_item)
-        except TypeError:
+        field_name = _FP_ITEM_FIELD_BY_TYPE.get(type(fp_item))
+        if field_name is None:
             raise TypeError(f"Unsupported footprint item type: {type(fp_item).__name__}")
+        getattr(self, field_name).append(fp_item)
 
     def get_directly_connected_footprints(
         self, footprints: Iterable["Footprint"]
@@ -1296,7 +1352,7 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
                 continue
             if net.name == "" or net.name == "GND":
                 continue
-            footprint_nets.add((net.name,))
+            footprint_nets.add(net.name)
 
         for other in footprints:
             if other == self:
@@ -1308,8 +1364,9 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
                     continue
                 if net.name == "" or net.name == "GND":
                     continue
-                if (net.name,) in footprint_nets:
+                if net.name in footprint_nets:
                     directly_connected.add(other)
+                    break  # one shared net is enough, the rest of other's pads don't matter
 
         return directly_connected
 
@@ -1321,7 +1378,20 @@ class Footprint(DataclassSerializerMixin, SexprMixin):
         return None
 
 
-@dataclass
+# board graphic item type -> the Board attribute holding items of that type
+_GR_ITEM_FIELD_BY_TYPE = {
+    GrText: 'gr_texts',
+    GrTextBox: 'gr_text_boxes',
+    GrLine: 'gr_lines',
+    GrRect: 'gr_rects',
+    GrCircle: 'gr_circles',
+    GrPoly: 'gr_polys',
+    GrCurve: 'gr_curves',
+    GrArc: 'gr_arcs',
+}
+
+
+@dataclass(slots=True)
 class Board(DataclassSerializerMixin, SexprMixin):
     version: int
     generator: Optional[str]
@@ -1358,10 +1428,9 @@ class Board(DataclassSerializerMixin, SexprMixin):
     embedded_fonts: Optional[bool]
     embedded_files: Optional[EmbeddedFiles]
 
-    _preserve_interleaved_order: List[str] = field(default_factory=lambda: ['segments', 'arcs', 'vias',
+    _preserve_interleaved_order: ClassVar[Tuple[str, ...]] = ('segments', 'arcs', 'vias',
                                    'dimensions',
-                                   'gr_arcs', 'gr_circles', 'gr_curves', 'gr_rects', 'gr_bboxs', 'gr_lines', 'gr_vectors', 'gr_polys', 'gr_texts', 'gr_text_boxes'])
-
+                                   'gr_arcs', 'gr_circles', 'gr_curves', 'gr_rects', 'gr_bboxs', 'gr_lines', 'gr_vectors', 'gr_polys', 'gr_texts', 'gr_text_boxes')
 
     @property
     def locked_components(self) -> Set[Footprint]:
@@ -1372,7 +1441,8 @@ class Board(DataclassSerializerMixin, SexprMixin):
         if not self.footprints:
             return BoundingBox(0, 0, 0, 0)
 
-        bbox = sum(footprint._bounding_box for footprint in self.footprints)
+        # union() returns a new bounding box, so padding it doesn't modify a footprint's _bounding_box
+        bbox = BoundingBox.union(footprint._bounding_box for footprint in self.footprints)
         bbox.x -= padding
         bbox.y -= padding
         bbox.width += 2 * padding
@@ -1390,124 +1460,173 @@ class Board(DataclassSerializerMixin, SexprMixin):
 
     def add_gr_item(self, gr_item: GrText | GrTextBox | GrLine | GrRect | GrCircle | GrPoly | GrCurve | GrArc):
         """Adds a graphic item to the board."""
-        try:
-            if isinstance(gr_item, GrText):
-                self.gr_text.append(gr_item)
-            elif isinstance(gr_item, GrTextBox):
-                self.gr_text_box.append(gr_item)
-            elif isinstance(gr_item, GrLine):
-                self.gr_line.append(gr_item)
-            elif isinstance(gr_item, GrRect):
-                self.gr_rect.append(gr_item)
-            elif isinstance(gr_item, GrCircle):
-                self.gr_circle.append(gr_item)
-            elif isinstance(gr_item, GrPoly):
-                self.gr_poly.append(gr_item)
-            elif isinstance(gr_item, GrCurve):
-                self.gr_curve.append(gr_item)
-            elif isinstance(gr_item, GrArc):
-                self.gr_arc.append(gr_item)
-        except TypeError:
+        field_name = _GR_ITEM_FIELD_BY_TYPE.get(type(gr_item))
+        if field_name is None:
             raise TypeError(f"Unsupported graphic item type: {type(gr_item).__name__}")
+        getattr(self, field_name).append(gr_item)
+
+
+def get_cached_arc_bounding_box(arc: Union["Arc", "FpArc", "GrArc"]) -> BoundingBox:
+    """get_arc_bounding_box() for an arc, memoized on the arc. The cache is keyed by the arc's points,
+    so moving any of them recomputes it instead of returning a stale box"""
+    start, mid, end = arc.start, arc.mid, arc.end
+    key = (start.x, start.y, None if mid is None else (mid.x, mid.y), end.x, end.y)
+    cached = arc._arc_bounding_box
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    bounding_box = get_arc_bounding_box(start, mid, end)
+    arc._arc_bounding_box = (key, bounding_box)
+    return bounding_box
 
 
-def get_element_bbox(
-    element: "GraphicItem",
-) -> BoundingBox:
-    """Calculate the bounding box for a given PCB element.
-
-    Args:
-        element (Union[FpRect, FpArc, FpLine, FpPoly, FpCurve, FpCircle]): The PCB element for which to calculate the bounding box.
-        transform (Optional[Position]): Optional transformation to apply to the bounding box.
+def get_placed_pad_bbox(bbox: BoundingBox, at: Vector2DWithRotation, cos_r: float, sin_r: float) -> BoundingBox:
+    """Places a pad bounding box on the board, for a footprint at `at`.
+    cos_r and sin_r are the cosine and sine of the footprint's rotation, so they're computed once per footprint.
 
-    Returns:
-        BoundingBox: The bounding box of the given element.
+    Same result as bbox.translate(at.x, at.y).rotate(-rot).rotate(rot, rotation_center=at), in one step.
+    The two rotations don't cancel out: the first one (about the box's own center) only grows the extents,
+    the second one grows them again and rotates the center about the footprint's position.
     """
+
+    half_width = bbox.width / 2
+    half_height = bbox.height / 2
+    for _ in range(2):
+        half_width, half_height = (abs(half_width * cos_r) + abs(half_height * sin_r),
+                                   abs(half_width * sin_r) + abs(half_height * cos_r))
+
+    # The box's center relative to the footprint is its center before the translation by `at`.
+    # Rotated with the same convention as Vector2D.rotate, which rotates by the negated angle
+    dx = bbox.x + bbox.width / 2
+    dy = bbox.y + bbox.height / 2
+    center_x = dx * cos_r + dy * sin_r + at.x
+    center_y = dy * cos_r - dx * sin_r + at.y
+
+    return BoundingBox(
+        center_x - half_width,
+        center_y - half_height,
+        half_width * 2,
+        half_height * 2,
+    )
+
+
+def _get_stroke_width(element: "GraphicItem") -> float:
+    """The stroke width to include in a graphic item's bounding box"""
     # When a graphical item has a stroke width, include the stroke width in the calculation of the bounding box,
     # but if the graphical item is a type that does not have a stroke width,
     # set the stroke width to 0 to keep the calculation code the same
-    if hasattr(element, 'stroke') and element.stroke is not None and element.stroke.width is not None:
-        stroke_width = element.stroke.width
-    elif hasattr(element, 'width'):
-        stroke_width = element.width
-    else:
-        # This is a default stroke width value (optional in itself) for elements starting from KiCAD v7,
-        # so it's preferable over raising an error
-        stroke_width = 0
+    stroke = element.stroke
+    if stroke is not None and stroke.width is not None:
+        return stroke.width
+    # This is a default stroke width value (optional in itself) for elements starting from KiCAD v7,
+    # so it's preferable over raising an error. GrPoly can have a .width instead of a stroke
+    return getattr(element, 'width', 0)
+
+
+def _get_rect_bbox(element: Union["FpRect", "GrRect"]) -> BoundingBox:
+    stroke_width = _get_stroke_width(element)
     half_stroke = stroke_width / 2
+    min_x = min(element.start.x, element.end.x)
+    min_y = min(element.start.y, element.end.y)
+    width = abs(element.end.x - element.start.x)
+    height = abs(element.end.y - element.start.y)
+    return BoundingBox(
+        min_x - half_stroke, min_y - half_stroke, width + stroke_width, height + stroke_width
+    )
 
-    if isinstance(element, FpRect) or isinstance(element, GrRect):
-        min_x = min(element.start.x, element.end.x)
-        min_y = min(element.start.y, element.end.y)
-        width = abs(element.end.x - element.start.x)
-        height = abs(element.end.y - element.start.y)
-        bounding_box = BoundingBox(
-            min_x - half_stroke, min_y - half_stroke, width + stroke_width, height + stroke_width
-        )
-
-    elif isinstance(element, FpCircle) or isinstance(element, GrCircle):
-        cx, cy = element.center.x, element.center.y
-        radius = abs(element.end.x - element.center.x)
-        bounding_box = BoundingBox(
-            cx - radius - half_stroke, cy - radius - half_stroke, radius * 2 + stroke_width, radius * 2 + stroke_width
-        )
-
-    elif isinstance(element, FpArc) or isinstance(element, GrArc):
-        bounding_box = get_arc_bounding_box(element.start, element.mid, element.end)
-        bounding_box = BoundingBox(
-            bounding_box.x - half_stroke,
-            bounding_box.y - half_stroke,
-            bounding_box.width + stroke_width,
-            bounding_box.height + stroke_width,
-        )
-
-    elif isinstance(element, FpLine) or isinstance(element, GrLine):
-        min_x = min(element.start.x, element.end.x)
-        min_y = min(element.start.y, element.end.y)
-        max_x = max(element.end.x, element.start.x)
-        max_y = max(element.end.y, element.start.y)
-        width = max_x - min_x
-        height = max_y - min_y
-        bounding_box = BoundingBox(
-            min_x - half_stroke, min_y - half_stroke, width + stroke_width, height + stroke_width
-        )
-
-    elif (
-        isinstance(element, FpPoly)
-        or isinstance(element, FpCurve)
-        or isinstance(element, GrPoly)
-        or isinstance(element, GrCurve)
-    ):
-        all_x_coords = []
-        all_y_coords = []
-        arc_bboxes = []
-
-        for point in element.pts.xys:
-            all_x_coords.append(point.x)
-            all_y_coords.append(point.y)
-
-        for arc in element.pts.arcs:
-            arc_bbox = get_arc_bounding_box(arc.start, arc.mid, arc.end)
-            arc_bboxes.append(arc_bbox)
-            all_x_coords.extend([arc_bbox.x, arc_bbox.x + arc_bbox.width])
-            all_y_coords.extend([arc_bbox.y, arc_bbox.y + arc_bbox.height])
-
-        if not all_x_coords:
-            return BoundingBox(0, 0, 0, 0)
 
-        min_x = min(all_x_coords)
-        min_y = min(all_y_coords)
-        max_x = max(all_x_coords)
-        max_y = max(all_y_coords)
+def _get_circle_bbox(element: Union["FpCircle", "GrCircle"]) -> BoundingBox:
+    stroke_width = _get_stroke_width(element)
+    half_stroke = stroke_width / 2
+    cx, cy = element.center.x, element.center.y
+    radius = abs(element.end.x - element.center.x)
+    return BoundingBox(
+        cx - radius - half_stroke, cy - radius - half_stroke, radius * 2 + stroke_width, radius * 2 + stroke_width
+    )
+
+
+def _get_arc_bbox(element: Union["FpArc", "GrArc"]) -> BoundingBox:
+    stroke_width = _get_stroke_width(element)
+    half_stroke = stroke_width / 2
+    bounding_box = element.arc_bounding_box
+    return BoundingBox(
+        bounding_box.x - half_stroke,
+        bounding_box.y - half_stroke,
+        bounding_box.width + stroke_width,
+        bounding_box.height + stroke_width,
+    )
+
+
+def _get_line_bbox(element: Union["FpLine", "GrLine"]) -> BoundingBox:
+    stroke_width = _get_stroke_width(element)
+    half_stroke = stroke_width / 2
+    min_x = min(element.start.x, element.end.x)
+    min_y = min(element.start.y, element.end.y)
+    max_x = max(element.end.x, element.start.x)
+    max_y = max(element.end.y, element.start.y)
+    width = max_x - min_x
+    height = max_y - min_y
+    return BoundingBox(
+        min_x - half_stroke, min_y - half_stroke, width + stroke_width, height + stroke_width
+    )
+
+
+def _get_poly_bbox(element: Union["FpPoly", "FpCurve", "GrPoly", "GrCurve"]) -> BoundingBox:
+    stroke_width = _get_stroke_width(element)
+    half_stroke = stroke_width / 2
+    xys = element.pts.xys
+    all_x_coords = [point.x for point in xys]
+    all_y_coords = [point.y for point in xys]
 
-        bounding_box = BoundingBox(
-            min_x - half_stroke, min_y - half_stroke, max_x - min_x + stroke_width, max_y - min_y + stroke_width
-        )
+    for arc in element.pts.arcs:
+        arc_bbox = arc.arc_bounding_box
+        all_x_coords += (arc_bbox.x, arc_bbox.x + arc_bbox.width)
+        all_y_coords += (arc_bbox.y, arc_bbox.y + arc_bbox.height)
 
-    else:
+    if not all_x_coords:
         return BoundingBox(0, 0, 0, 0)
 
-    return bounding_box
+    min_x = min(all_x_coords)
+    min_y = min(all_y_coords)
+    max_x = max(all_x_coords)
+    max_y = max(all_y_coords)
+
+    return BoundingBox(
+        min_x - half_stroke, min_y - half_stroke, max_x - min_x + stroke_width, max_y - min_y + stroke_width
+    )
+
+
+# graphic item type -> the function computing its bounding box
+_ELEMENT_BBOX_GETTERS = {
+    FpRect: _get_rect_bbox,
+    GrRect: _get_rect_bbox,
+    FpCircle: _get_circle_bbox,
+    GrCircle: _get_circle_bbox,
+    FpArc: _get_arc_bbox,
+    GrArc: _get_arc_bbox,
+    FpLine: _get_line_bbox,
+    GrLine: _get_line_bbox,
+    FpPoly: _get_poly_bbox,
+    FpCurve: _get_poly_bbox,
+    GrPoly: _get_poly_bbox,
+    GrCurve: _get_poly_bbox,
+}
+
+
+def get_element_bbox(
+    element: "GraphicItem",
+) -> BoundingBox:
+    """Calculate the bounding box for a given PCB element.
+
+    Args:
+        element (Union[FpRect, FpArc, FpLine, FpPoly, FpCurve, FpCircle]): The PCB element for which to calculate the bounding box.
+
+    Returns:
+        BoundingBox: The bounding box of the given element, or an empty one for types without a bounding box (like texts).
+    """
+    bbox_getter = _ELEMENT_BBOX_GETTERS.get(type(element))
+    if bbox_getter is None:
+        return BoundingBox(0, 0, 0, 0)
+    return bbox_getter(element)
 
 
 GraphicItem = Union[FpArc, FpLine, FpPoly, FpCurve, FpRect, GrArc, GrLine, GrPoly, GrCurve, GrBBox, GrTextBox, GrVector, GrCircle, GrRect, GrText, GrTextBox]
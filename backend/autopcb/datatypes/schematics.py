@@ -1,13 +1,14 @@
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 import math
 import re
 import sys
 import time
-from typing import Any, List, Optional, Set, Union, Dict, Tuple
+from typing import Any, ClassVar, List, Optional, Set, Union, Dict, Tuple
 
 from autopcb.datatypes.common import Vector2D, Vector2DWithRotation
+from autopcb.sexpr import InterleavedOrderItem
 from autopcb.datatypes.mixins import SexprMixin, DataclassSerializerMixin
 from autopcb.exceptions import MissingSchematicSymbolException
 
@@ -15,7 +16,7 @@ from .fields import positional, flag_boolean
 from autopcb.datatypes.common import Margins
 
 
-@dataclass
+@dataclass(slots=True)
 class PinLoc:
     """A single pin (logical endpoint) in the schematic."""
     symbol_inst: "SchSymbol"         
@@ -23,7 +24,7 @@ class PinLoc:
     pos: Vector2DWithRotation
 
 
-@dataclass
+@dataclass(slots=True)
 class SchematicSymbolMetadata:
     footprint: str | None
     lcsc_part: str | None
@@ -35,13 +36,13 @@ class SchematicSymbolMetadata:
 Point = Tuple[float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     other_node: Point
     distance: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchFont:
     face: Optional[str]
     size: Optional[Vector2D]
@@ -52,7 +53,7 @@ class SchFont:
     line_spacing: Optional[float]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchEffects:
     font: Optional[SchFont]
     justifies: List[str]
@@ -60,7 +61,7 @@ class SchEffects:
     hide: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class Color:
     r: int = positional()  # 255
     g: int = positional()
@@ -68,20 +69,20 @@ class Color:
     a: float = positional()  # 0-1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchStroke:
     width: float
     type: str = "default"
     color: Optional[Color]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Fill:
     type: str = "none"
     color: Optional[Color]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchPageInfo:
     type: str = positional()
     width: Optional[float] = positional()
@@ -89,13 +90,13 @@ class SchPageInfo:
     portrait: bool = flag_boolean()
 
 
-@dataclass
+@dataclass(slots=True)
 class SchTitleBlockComment:
     index: int = positional()
     text: str = positional()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchTitleBlock:
     title: Optional[str]
     date: Optional[str]
@@ -104,23 +105,23 @@ class SchTitleBlock:
     comments: List[SchTitleBlockComment]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchShapeLineChain:
     xys: List[Vector2D]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinNames:
     offset: Optional[float]
     hide: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinNumbers:
     hide: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchProperty:
     name: str = positional()
     value: str = positional()
@@ -133,26 +134,26 @@ class SchProperty:
     do_not_autoplace: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinAlternate:
     name: str = positional()
     type: str = positional()
     shape: str = positional()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinName:
     name: str = positional()
     effects: Optional[SchEffects]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinNumber:
     number: str = positional()  # yes, this is a str
     effects: Optional[SchEffects]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Pin:
     type: str = positional()
     shape: str = positional()
@@ -165,7 +166,7 @@ class Pin:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ArcShape:
     private: bool = flag_boolean()
     start: Vector2D
@@ -176,7 +177,7 @@ class ArcShape:
     fill: Optional[Fill]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Bezier:
     private: bool = flag_boolean()
     pts: SchShapeLineChain
@@ -184,7 +185,7 @@ class Bezier:
     fill: Optional[Fill]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Circle:
     private: bool = flag_boolean()
     center: Vector2D
@@ -193,7 +194,7 @@ class Circle:
     fill: Optional[Fill]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Polyline:
     private: bool = flag_boolean()
     pts: Optional[SchShapeLineChain]
@@ -201,7 +202,7 @@ class Polyline:
     fill: Optional[Fill]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Rectangle:
     private: bool = flag_boolean()
     start: Vector2D
@@ -211,7 +212,7 @@ class Rectangle:
     fill: Optional[Fill]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchFreeformText:
     text: str = positional()
     private: bool = flag_boolean()
@@ -219,7 +220,7 @@ class SchFreeformText:
     effects: Optional[SchEffects]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchTextBox:
     text: str = positional()
     exclude_from_sim: Optional[bool]
@@ -232,7 +233,7 @@ class SchTextBox:
     uuid: Optional[str]
 
     
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SymbolUnit: 
     name: str = positional()
     unit_name: Optional[str]
@@ -256,25 +257,25 @@ class SymbolUnit:
             self._variant = int(parse_symbol_id.group(3))
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BodyStyles:
     demorgan: bool = flag_boolean()
     names: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchEmbeddedFile:
     name: str
     data: str
     type: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerFlag:
     pass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LibSymbol(DataclassSerializerMixin):
     name: str = positional()
     power: Optional[PowerFlag]
@@ -295,12 +296,17 @@ class LibSymbol(DataclassSerializerMixin):
     @property
     def metadata(self) -> SchematicSymbolMetadata:
         """Gets basic symbol properties"""
+        # One pass over the properties instead of a get_property scan per field.
+        # setdefault keeps the first property with a given name, like get_property does
+        values: Dict[str, str] = {}
+        for symbol_property in self.properties:
+            values.setdefault(symbol_property.name, symbol_property.value)
         return SchematicSymbolMetadata(
-            footprint=self.get_property('Footprint'),
-            lcsc_part=self.get_property('LCSC Part'),
-            reference=self.get_property('Reference'),
-            value=self.get_property('Value'),
-            datasheet=self.get_property('Datasheet'),
+            footprint=values.get('Footprint'),
+            lcsc_part=values.get('LCSC Part'),
+            reference=values.get('Reference'),
+            value=values.get('Value'),
+            datasheet=values.get('Datasheet'),
         )
    
     def get_property(self, key: str, fallback: str | None = None) -> SchProperty | None:
@@ -346,7 +352,7 @@ class LibSymbol(DataclassSerializerMixin):
                 all_pins.append(pin)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchReferenceImage:
     at: Vector2D
     scale: float = 1.0
@@ -354,7 +360,7 @@ class SchReferenceImage:
     datas: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SheetPin:
     name: str = positional()
     shape: str = positional()
@@ -363,18 +369,18 @@ class SheetPin:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SheetInstancePath:
     path: str = positional()
     page: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SheetInstances:
     paths: List[SheetInstancePath]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchField:
     name: str = positional()
     value: str = positional()
@@ -387,7 +393,7 @@ class SchField:
     do_not_autoplace: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sheet:
     at: Vector2D
     size: Vector2D
@@ -405,7 +411,7 @@ class Sheet:
     instances: List[Dict[str, List[SheetInstances]]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Color:
     r: int = positional()  # 255
     g: int = positional()
@@ -413,7 +419,7 @@ class Color:
     a: float = positional()  # 0-1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Junction:
     at: Vector2D
     diameter: Optional[float]
@@ -421,13 +427,13 @@ class Junction:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NoConnectMark:
     at: Vector2D
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BusEntry:
     at: Vector2D
     size: Optional[Vector2D]
@@ -435,23 +441,23 @@ class BusEntry:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
-class Bus:
+@dataclass(kw_only=True, slots=True)
+class Bus(InterleavedOrderItem):
     size: Optional[Vector2D]
     pts: Optional[SchShapeLineChain]
     stroke: Optional[SchStroke]
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
-class SchPolyline:
+@dataclass(kw_only=True, slots=True)
+class SchPolyline(InterleavedOrderItem):
     pts: Optional[SchShapeLineChain]
     stroke: Optional[SchStroke]
     fill: Optional[Fill]
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchArc:
     start: Vector2D
     mid: Vector2D
@@ -461,7 +467,7 @@ class SchArc:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchCircle:
     center: Vector2D
     radius: float
@@ -470,7 +476,7 @@ class SchCircle:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchRectangle:
     start: Vector2D
     end: Vector2D
@@ -480,7 +486,7 @@ class SchRectangle:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchBezier:
     pts: Optional[SchShapeLineChain]
     stroke: Optional[SchStroke]
@@ -488,7 +494,7 @@ class SchBezier:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchRuleArea:
     polyline: Optional[SchPolyline]
     exclude_from_sim: Optional[bool]
@@ -497,13 +503,13 @@ class SchRuleArea:
     dnp: Optional[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BusAlias:
     name: str = positional()
     memberss: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchGroup:
     name: Optional[str] = positional()
     uuid: Optional[str]
@@ -511,7 +517,7 @@ class SchGroup:
     members: List[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TableCell:
     text: str = positional()
     at: Vector2DWithRotation
@@ -524,21 +530,21 @@ class TableCell:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchTableBorder:
     external: bool
     header: bool
     stroke: Optional[SchStroke]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchTableSeparators:
     rows: bool
     cols: bool
     stroke: Optional[SchStroke]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchTable:
     column_count: int
     column_widths: List[float]
@@ -549,7 +555,7 @@ class SchTable:
     uuid: Optional[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchText:
     text: str = positional()
     shape: Optional[str]
@@ -563,14 +569,14 @@ class SchText:
     properties: List[SchField]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchSymbolInstancePath:
     path: str = positional()
     reference: str
     unit: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchSymbolInstance:
     name: str = positional()
     path: SchSymbolInstancePath
@@ -578,12 +584,12 @@ class SchSymbolInstance:
     # variants: Optional[Dict[str, Dict[str, Union[bool, str]]]]
 
 
-@dataclass
+@dataclass(slots=True)
 class InstanceList:
     projects: List[SchSymbolInstance]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchSymbol:
     lib_id: Optional[str]
     lib_name: Optional[str]
@@ -621,19 +627,19 @@ class SchSymbol:
         return None
 
 
-@dataclass
-class Wire:
+@dataclass(slots=True)
+class Wire(InterleavedOrderItem):
     pts: SchShapeLineChain
     stroke: SchStroke
     uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LibSymbols:
     symbols: List[LibSymbol]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SymbolLibrary(SexprMixin):
     """ For parsing .kicad_sym files """
     version: int
@@ -662,7 +668,7 @@ class SymbolLibrary(SexprMixin):
             raise MissingSchematicSymbolException(chip_id)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Schematic(SexprMixin):
     """ For parsing .kicad_sch files """
     version: int
@@ -702,12 +708,13 @@ class Schematic(SexprMixin):
     embedded_files: List[SchEmbeddedFile]
     groups: List[SchGroup]
 
-    _preserve_interleaved_order = ['wires', 'polylines', 'buss']
+    _preserve_interleaved_order: ClassVar[Tuple[str, ...]] = ('wires', 'polylines', 'buss')
 
     @property
     def connection_lines(self) -> list[Bus | Wire | SchPolyline]:
         """Returns a list of items that are used to draw connections between pins."""
-        return self.wires + self.polylines + self.buss
+        # built in one go; chaining + would copy the wires into an intermediate list first
+        return [*self.wires, *self.polylines, *self.buss]
 
     def _all_pin_locs(self) -> List[PinLoc]:
         """
@@ -716,8 +723,13 @@ class Schematic(SexprMixin):
         """
         pins: list[PinLoc] = []
 
-        # Build a mapping from libId to libSymbol for fast lookup
-        lib_id_map = {lib.name: lib for lib in self.lib_symbols.symbols}
+        # Build a mapping from libId to libSymbol for fast lookup, built once per call.
+        # Reversed so that if two lib symbols share a name, the first one wins, like in find_symbol_instance_parent
+        lib_id_map = {lib.name: lib for lib in reversed(self.lib_symbols.symbols)}
+        # Decimal coordinates of each library pin, converted once and shared by every instance of its symbol
+        lib_pin_positions: dict[int, tuple[Decimal, Decimal, Decimal]] = {}
+        # pins of each (libId, unit, body style), shared by every instance of that symbol unit
+        lib_pinlists: dict[tuple[str, int, Optional[int]], List[Pin]] = {}
 
         # For each schematic symbol instance
         for symbol_instance in self.symbols:
@@ -731,12 +743,16 @@ class Schematic(SexprMixin):
                 rot=Decimal(str(symbol_instance.at.rot))
             )
             
-            # If the parent symbol does not have multiple units and the symbol instance unitId is 0, change it to 1 for pinlist
-            pinlist_unit = symbol_instance.unit
-            if not parent_lib_symbol.has_multiple_units() and pinlist_unit == 0:
-                pinlist_unit = 1
-                
-            for pin in parent_lib_symbol.pinlist(unit=pinlist_unit, variant=symbol_instance.body_style):
+            pinlist_key = (symbol_instance.lib_id, symbol_instance.unit, symbol_instance.body_style)
+            pinlist = lib_pinlists.get(pinlist_key)
+            if pinlist is None:
+                # If the parent symbol does not have multiple units and the symbol instance unitId is 0, change it to 1 for pinlist
+                pinlist_unit = symbol_instance.unit
+                if not parent_lib_symbol.has_multiple_units() and pinlist_unit == 0:
+                    pinlist_unit = 1
+                pinlist = lib_pinlists[pinlist_key] = parent_lib_symbol.pinlist(unit=pinlist_unit, variant=symbol_instance.body_style)
+
+            for pin in pinlist:
                 # Power symbols used to required having their pins marked as hidden (even though they show)
                 # in older versions of kicad: https://klc.kicad.org/symbol/s7/s7.1/
                 if pin.hide and not parent_lib_symbol.power:
@@ -749,10 +765,17 @@ class Schematic(SexprMixin):
                 #     if( o.mirror_y )
                 #         item.MirrorHorizontally( 0 );
                 # https://github.com/KiCad/kicad-source-mirror/blob/8c017c7503d530d0fb7900360bed033ac80eb12b/eeschema/symb_transforms_utils.cpp#L56
+                lib_pin_position = lib_pin_positions.get(id(pin))
+                if lib_pin_position is None:
+                    lib_pin_position = lib_pin_positions[id(pin)] = (
+                        Decimal(str(pin.at.x)),
+                        -Decimal(str(pin.at.y)),  # For some reason (idk why), pin's y coordinates need to be negated
+                        Decimal(str(pin.at.rot)),
+                    )
                 pin_position = Vector2DWithRotation(
-                    x=Decimal(str(pin.at.x)),
-                    y=-Decimal(str(pin.at.y)),  # For some reason (idk why), pin's y coordinates need to be negated
-                    rot=Decimal(str(pin.at.rot))
+                    x=lib_pin_position[0],
+                    y=lib_pin_position[1],
+                    rot=lib_pin_position[2],
                 )
                 angle = symbol_instance.at.rot
                 if angle is not None:
@@ -773,6 +796,7 @@ class Schematic(SexprMixin):
         """
         Finds the parent symbol of a symbol instance.
         """
+        # a single lookup, so scan rather than build a map. If two lib symbols share a name, the first one wins
         lib_symbol = next((lib for lib in self.lib_symbols.symbols if lib.name == symbol_instance.lib_id), None)
         if lib_symbol is None:
             raise Exception(f"Lib symbol not found for {symbol_instance.lib_id}. This should never happen.")
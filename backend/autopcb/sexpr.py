@@ -1,6 +1,7 @@
 import re
 import sys
-from dataclasses import fields, is_dataclass, dataclass, MISSING
+from dataclasses import Field, field, fields, is_dataclass, dataclass, MISSING
+from functools import lru_cache
 from typing import List, Optional, Union, Tuple, get_origin, get_args, get_type_hints
 
 POSITIONAL_FIELD_METADATA_FLAG = 'positional_flag'
@@ -17,29 +18,35 @@ term_regex = r'''(?mx)
         (?P<sq>"(?:[^"]|(?<=\\)")*"(?:(?=\))|(?=\s)))|
         (?P<s>[^(^)\s]+)
        )'''
+term_pattern = re.compile(term_regex)
 
 def parse_sexp(sexp):
     stack = []
     out = []
+    append = out.append
     if dbg: print("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
-    for termtypes in re.finditer(term_regex, sexp):
-        term, value = [(t,v) for t,v in termtypes.groupdict().items() if v][0]
+    for termtypes in term_pattern.finditer(sexp):
+        # The alternatives are mutually exclusive, so the last matched group is the only matched one
+        term = termtypes.lastgroup
+        value = termtypes.group(term)
         if dbg: print("%-7s %-14s %-44r %-r" % (term, value, out, stack))
         if   term == 'brackl':
             stack.append(out)
             out = []
+            append = out.append
         elif term == 'brackr':
             assert stack, "Trouble with nesting of brackets"
             tmpout, out = out, stack.pop(-1)
-            out.append(tmpout)
+            append = out.append
+            append(tmpout)
+        elif term == 's':
+            append(value)
         elif term == 'num':
             v = float(value)
             if v.is_integer(): v = int(v)
-            out.append(v)
+            append(v)
         elif term == 'sq':
-            out.append(value[1:-1].replace(r'\"', '"'))
-        elif term == 's':
-            out.append(value)
+            append(value[1:-1].replace(r'\"', '"'))
         else:
             raise NotImplementedError("Error: %r" % (term, value))
     assert not stack, "Trouble with nesting of brackets"
@@ -228,6 +235,39 @@ def convert_plural_to_singular_if_list(name, variable_type):
     return name[:-1]  # remove the trailing 's'
 
 
+def get_preserve_interleaved_order(cls) -> tuple[str, ...]:
+    """The class-level _preserve_interleaved_order attribute names, or () if the class doesn't declare any.
+    Declare it as a ClassVar tuple; an instance field has no class-level value to read here"""
+    value = getattr(cls, '_preserve_interleaved_order', ())
+    if not isinstance(value, (tuple, list)):
+        raise TypeError(f"{cls.__name__}._preserve_interleaved_order must be a ClassVar tuple of attribute names")
+    return tuple(value)
+
+
+@dataclass(slots=True)
+class InterleavedOrderItem:
+    """Base for the item types of attributes listed in some class's _preserve_interleaved_order.
+    parse_dataclass stores each item's row in its parent s-expression in _order_index, and serialize_dataclass
+    sorts on it to write the items back in file order. Items created in code have no row (None),
+    so they are written after the parsed ones"""
+    _order_index: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+
+# String attributes that take a handful of distinct values across a whole board ("F.Cu", "passive", ...).
+# They get sys.intern()ed while parsing so every instance shares one string object.
+# A class can intern more of its own attributes by listing them in a class-level _interned_fields, like Net does
+INTERNED_STRING_FIELDS = frozenset({'layer', 'layers', 'pintype', 'pinfunction'})
+
+
+def intern_strings(value):
+    """sys.intern a parsed str, or every str in a parsed list of them"""
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return [sys.intern(v) if type(v) is str else v for v in value]
+    return value
+
+
 @dataclass
 class ParsingStackElement:
     attribute_name: str
@@ -238,6 +278,47 @@ class ParsingStackElement:
 parsing_stack: list[ParsingStackElement] = []
 
 
+@dataclass(frozen=True)
+class DataclassParsePlan:
+    """Everything parse_dataclass needs to know about a class that doesn't depend on the data being parsed"""
+    # public fields keyed by their (singular, if a list) s-expression name
+    fields_dict: dict[str, Field]
+    fields_list: list[Field]
+    # all fields keyed by attribute name, and their resolved type hints
+    fields_by_name: dict[str, Field]
+    type_hints: dict
+    index_from_0: bool
+    is_layer_list: bool
+    # s-expression names of the attributes listed in _preserve_interleaved_order
+    interleaved_list_keys: frozenset[str]
+    interleaved_scalar_keys: frozenset[str]
+    # attribute names whose parsed strings get interned
+    interned_fields: tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def get_parse_plan(cls) -> DataclassParsePlan:
+    """Introspects a dataclass once, so parsing many instances of it doesn't redo fields()/get_type_hints()"""
+    from autopcb.datatypes.pcb import LayerList
+    # if not f.name.startswith('_') to filter out private attributes
+    fields_dict = {convert_plural_to_singular_if_list(f.name, f.type): f for f in fields(cls) if not f.name.startswith('_')}
+    preserve_interleaved_order = get_preserve_interleaved_order(cls)
+    interned_field_names = INTERNED_STRING_FIELDS.union(getattr(cls, '_interned_fields', ()))
+    return DataclassParsePlan(
+        fields_dict=fields_dict,
+        fields_list=list(fields_dict.values()),
+        fields_by_name={f.name: f for f in fields(cls)},
+        type_hints=get_type_hints(cls),
+        index_from_0=hasattr(cls, '_index_from_0'),
+        # compare names rather than the actual objects, since the import paths could be different (ex. if debugging the pcb.py locally, cls will be __main__.LayerList while the right hand side will be autopcb.dataclasses.pcb.LayerList
+        is_layer_list=cls.__name__ == LayerList.__name__,
+        # arg of convert_plural_to_singular_if_list anything other than list for scalar attributes
+        interleaved_list_keys=frozenset(convert_plural_to_singular_if_list(i, list) for i in preserve_interleaved_order),
+        interleaved_scalar_keys=frozenset(convert_plural_to_singular_if_list(i, int) for i in preserve_interleaved_order),
+        interned_fields=tuple(f.name for f in fields_dict.values() if f.name in interned_field_names),
+    )
+
+
 def parse_dataclass(cls,
                     sexp,
                     attribute_name: str,
@@ -245,9 +326,9 @@ def parse_dataclass(cls,
                     print_debug=False):
     parsing_stack.append(ParsingStackElement(attribute_name, attribute_index))
 
-    # if not f.name.startswith('_') to filter out private attributes
-    fields_dict = {convert_plural_to_singular_if_list(f.name, f.type): f for f in fields(cls) if not f.name.startswith('_')}
-    fields_list = list(fields_dict.values())
+    plan = get_parse_plan(cls)
+    fields_dict = plan.fields_dict
+    fields_list = plan.fields_list
 
     attribute_values = {}
 
@@ -255,7 +336,7 @@ def parse_dataclass(cls,
     _preserve_interleaved_order_values: list[str] = []
 
     for row, item in enumerate(sexp):
-        if row == 0 and not hasattr(cls, '_index_from_0'):
+        if row == 0 and not plan.index_from_0:
             # skip the 0th item, as it is the type name. Ex. (layer "B.Cu" (type "copper"))
             # except for classes (like Layer) that don't have the class name as the 0th element:
             # Ex. (4 "In4.Cu" power "Ground2")
@@ -264,8 +345,7 @@ def parse_dataclass(cls,
         try:
             if isinstance(item, list):  # If the sexpression is of the form (attr_name stuff stuff stuff)
                 key = item[0]
-                from autopcb.datatypes.pcb import LayerList
-                if cls.__name__ == LayerList.__name__:  # compare names rather than the actual objects, since the import paths could be different (ex. if debugging the pcb.py locally, cls will be __main__.LayerList while the right hand side will be autopcb.dataclasses.pcb.LayerList
+                if plan.is_layer_list:
                     # There is one class (Layer) in the entire file format
                     # that doesn't include the key type as the 0th element,
                     # so we have to manually specify its type
@@ -288,15 +368,14 @@ def parse_dataclass(cls,
                         else:
                             val = [parse_primitive(item_t, [element]) for element in item[1:]]
 
-                        if key in [convert_plural_to_singular_if_list(i, list) for i in getattr(cls, '_preserve_interleaved_order', [])]:
+                        if key in plan.interleaved_list_keys:
                             # _preserve_interleaved_order is a list of strings, of attribute names,
                             # that should have their interleaved ordering preserved when serializing again
                             setattr(val[-1], '_order_index', row)
                     else:
                         t_concrete = remove_optional_type_wrapper(t)
                         val = parse_dataclass(t_concrete, item, key, print_debug=print_debug) if is_dataclass(t_concrete) else parse_primitive(t_concrete, item[1:])
-                        # arg of convert_plural_to_singular_if_list anything other than list
-                        if key in [convert_plural_to_singular_if_list(i, int) for i in getattr(cls, '_preserve_interleaved_order', [])]:
+                        if key in plan.interleaved_scalar_keys:
                             # _preserve_interleaved_order is a list of strings, of attribute names,
                             # that should have their interleaved ordering preserved when serializing again
                             setattr(val, '_order_index', row)
@@ -312,7 +391,6 @@ def parse_dataclass(cls,
                 # Ex. Positional `smd` in (footprint smd (at 0 0))
                 # Ex. Boolean flag `unlocked` in (footprint (at 0 0) unlocked)
 
-                type_annotations = get_type_hints(cls)
                 # todo fixme
                 # how should we handle the case of a positional arg's value matching the name of a boolean arg?
                 # that will fail paring right now
@@ -330,7 +408,7 @@ def parse_dataclass(cls,
                     # and 1 and 2 are positional args for x and y
                     # (drill 1 2)
                     # (drill oval 1 2)
-                    dataclass_field = fields_list[row - (1 if not hasattr(cls, '_index_from_0') else 0) - how_many_boolean_flags_parsed]
+                    dataclass_field = fields_list[row - (0 if plan.index_from_0 else 1) - how_many_boolean_flags_parsed]
                     t = dataclass_field.type
                     attr_name = dataclass_field.name
                     if print_debug:
@@ -379,8 +457,8 @@ def parse_dataclass(cls,
 
     # Fill in default values for non-optional attributes,
     # so the data is guaranteed to match the shape (for safety in typescript)
-    fields_dict = {f.name: f for f in fields(cls)}
-    for attribute_name, type_hint in get_type_hints(cls).items():
+    fields_dict = plan.fields_by_name
+    for attribute_name, type_hint in plan.type_hints.items():
         if attribute_name.startswith('_'):
             continue  # skip private attributes
         if attribute_name not in attribute_values:  # if the attribute was not found in the data
@@ -413,6 +491,9 @@ def parse_dataclass(cls,
                     print(f'\033[91mAttribute .{attribute_name} with type {attribute_type.__name__} in class {cls.__name__} is marked as required, '
                           f'but isn\'t in the file being parsed\033[0m')
                     raise NotImplementedError()
+    for attribute_name in plan.interned_fields:
+        if attribute_name in attribute_values:
+            attribute_values[attribute_name] = intern_strings(attribute_values[attribute_name])
     parsing_stack.pop()
     return cls(**attribute_values)
 
@@ -509,6 +590,8 @@ def serialize_dataclass(instance):
     sexp.extend(positionals)
     sexp.extend(flags)
 
+    preserve_interleaved_order = get_preserve_interleaved_order(cls)
+
     # tuple is (order_index, the s expression element)
     order_preserved_attributes: list[tuple[int, list | str | int | float]] = []
     index_to_add_ordered_attributes_to = None
@@ -518,7 +601,7 @@ def serialize_dataclass(instance):
         if f.name.startswith('_'):
             continue  # skip private fields
 
-        if f.name in getattr(cls, '_preserve_interleaved_order', []) and index_to_add_ordered_attributes_to is None:
+        if f.name in preserve_interleaved_order and index_to_add_ordered_attributes_to is None:
             index_to_add_ordered_attributes_to = len(sexp)
 
         if f.metadata.get(POSITIONAL_FIELD_METADATA_FLAG, False) or f.metadata.get(BOOLEAN_FLAG_ATTRIBUTE_METADATA_FLAG, False):
@@ -563,7 +646,7 @@ def serialize_dataclass(instance):
                     else:
                         item_to_add = [key] + item_ser
 
-                    if f.name in getattr(cls, '_preserve_interleaved_order', []):
+                    if f.name in preserve_interleaved_order:
                         order_preserved_attributes.append((getattr(item, '_order_index'), item_to_add))
                     else:
                         sexp.append(item_to_add)
@@ -572,7 +655,7 @@ def serialize_dataclass(instance):
                     item_ser = [serialize_primitive(item)[0] for item in val]
                     item_to_add = [key] + item_ser
 
-                    if f.name in getattr(cls, '_preserve_interleaved_order', []):
+                    if f.name in preserve_interleaved_order:
                         order_preserved_attributes.append((getattr(item, '_order_index'), item_to_add))
                     else:
                         sexp.append(item_to_add)
@@ -593,7 +676,9 @@ def serialize_dataclass(instance):
             sexp.append([key] + ser)
             # todo do we need to support order_preserved_attributes here?
 
-    ordered_attributes_to_add = [i[1] for i in sorted(order_preserved_attributes, key=lambda e: e[0])]
+    # Items that weren't parsed from a file (added in code, or loaded from JSON) have no order index. The sort is
+    # stable, so they keep their field order, after the parsed items
+    ordered_attributes_to_add = [i[1] for i in sorted(order_preserved_attributes, key=lambda e: (e[0] is None, e[0] or 0))]
     if index_to_add_ordered_attributes_to is None:
         sexp.extend(ordered_attributes_to_add)  # add it to the end if no attribute before marked to splice it earlier
     else:
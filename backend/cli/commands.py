@@ -23,7 +23,14 @@ def server_cli():
 @click.option("--host", default="0.0.0.0", help="Host to bind to")
 @click.option("--port", default=8000, type=int, help="Port to bind to")
 @click.option("--reload", is_flag=True, help="Enable auto-reload")
-def server_run(host: str, port: int, reload: bool):
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    envvar="WEB_CONCURRENCY",
+    help="Number of worker processes, ignored with --reload (default: 1)",
+)
+def server_run(host: str, port: int, reload: bool, workers: int):
     """Run the development server."""
     import uvicorn
 
@@ -32,6 +39,7 @@ def server_run(host: str, port: int, reload: bool):
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
     )
 
 
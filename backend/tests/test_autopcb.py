@@ -0,0 +1,269 @@
+"""Tests for the autopcb KiCad datatypes."""
+
+import re
+from dataclasses import dataclass, field, fields, replace
+
+import pytest
+from dacite import WrongTypeError
+
+from autopcb.datatypes.common import BoundingBox, Vector2D, Vector2DWithRotation
+from autopcb.datatypes.mixins import DataclassSerializerMixin
+from autopcb.datatypes.pcb import _FP_ITEM_FIELDS, Board, Footprint
+from autopcb.datatypes.schematics import Schematic
+from autopcb.sexpr import get_preserve_interleaved_order, parse_sexp
+
+FOOTPRINT_SEXPR = """(footprint "R_0603" (layer "F.Cu") (uuid "fp") (at 10 20 90)
+ (fp_line (start -0.2 -0.4) (end 0.2 -0.4) (stroke (width 0.12) (type solid)) (layer "F.SilkS") (uuid "l1"))
+ (fp_arc (start -1 0) (mid 0 1) (end 1 0) (stroke (width 0.12) (type solid)) (layer "F.SilkS") (uuid "a1"))
+ (fp_line (start -0.2 0.4) (end 0.2 0.4) (stroke (width 0.12) (type solid)) (layer "F.SilkS") (uuid "l2"))
+ (fp_poly (pts (xy 0 0) (arc (start 1 0) (mid 1.5 0.5) (end 2 0)) (xy 2 1))
+  (stroke (width 0.1) (type solid)) (fill yes) (layer "F.Cu") (uuid "p1"))
+ (pad "1" smd roundrect (at -0.775 0 90) (size 0.9 0.95) (layers "F.Cu" "F.Paste" "F.Mask") (uuid "pad1"))
+)"""
+
+TEXT_ONLY_PAD_FOOTPRINT_SEXPR = """(footprint "TP" (layer "F.Cu") (uuid "tp") (at 10 20)
+ (pad "1" smd custom (at 1 2) (size 0.5 0.5) (layers "F.Cu")
+  (primitives (gr_text "A" (at 0 0) (layer "F.Cu") (effects (font (size 1 1))))) (uuid "pad1"))
+)"""
+
+BOARD_SEXPR = """(kicad_pcb (version 20240108) (generator "pcbnew")
+ (general (thickness 1.6))
+ (paper "A4")
+ (layers (0 "F.Cu" signal) (31 "B.Cu" signal))
+ (net 0 "") (net 1 "GND")
+ (segment (start 1 1) (end 2 2) (width 0.25) (layer "F.Cu") (net 1) (uuid "s1"))
+ (via (at 2 2) (size 0.6) (drill 0.3) (layers "F.Cu" "B.Cu") (net 1) (uuid "v1"))
+ (segment (start 2 2) (end 3 3) (width 0.25) (layer "B.Cu") (net 1) (uuid "s2"))
+)"""
+
+DUPLICATE_LIB_SYMBOL_SCHEMATIC = """(kicad_sch (version 20231120) (generator "eeschema") (uuid "root") (paper "A4")
+ (lib_symbols
+  (symbol "Lib:X" (property "Value" "first" (at 0 0 0))
+   (symbol "X_1_1" (pin passive line (at 0 0 0) (length 1) (name "A") (number "1"))))
+  (symbol "Lib:X" (property "Value" "second" (at 0 0 0))
+   (symbol "X_1_1" (pin passive line (at 5 0 0) (length 1) (name "B") (number "1")))))
+ (symbol (lib_id "Lib:X") (at 10 10 0) (unit 1) (uuid "s1") (property "Reference" "U1" (at 0 0 0)))
+)"""
+
+
+def _rotate_corners(bbox: BoundingBox, rotation: float, rotation_center: Vector2D | None) -> BoundingBox:
+    """Rotates the four corners of the box one by one and returns the box around them."""
+    if rotation_center is None:
+        rotation_center = bbox.center
+    corners = [
+        Vector2D(bbox.x, bbox.y),
+        Vector2D(bbox.x + bbox.width, bbox.y),
+        Vector2D(bbox.x, bbox.y + bbox.height),
+        Vector2D(bbox.x + bbox.width, bbox.y + bbox.height),
+    ]
+    for corner in corners:
+        corner.rotate(rotation_center, rotation)
+    min_x = min(corner.x for corner in corners)
+    min_y = min(corner.y for corner in corners)
+    return BoundingBox(min_x, min_y, max(c.x for c in corners) - min_x, max(c.y for c in corners) - min_y)
+
+
+def _keywords(sexpr: str, *names: str) -> list[str]:
+    return re.findall(rf"\(({'|'.join(names)})\b", sexpr)
+
+
+class TestPreserveInterleavedOrder:
+    """Tests for keeping the file order of items stored in separate lists."""
+
+    def test_preserve_interleaved_order_is_read_from_the_class(self):
+        """Test the ClassVar tuples are picked up by the parser and serializer."""
+        assert get_preserve_interleaved_order(Footprint)[:2] == ("fp_arcs", "fp_circles")
+        assert "segments" in get_preserve_interleaved_order(Board)
+
+    def test_footprint_round_trip_keeps_item_order(self):
+        """Test fp_* items are written back in the order they were read."""
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        output = footprint.to_sexpr("footprint")
+        assert _keywords(output, "fp_line", "fp_arc", "fp_poly") == [
+            "fp_line",
+            "fp_arc",
+            "fp_line",
+            "fp_poly",
+        ]
+        assert _keywords(output, "xy", "arc") == ["xy", "arc", "xy"]
+
+    def test_board_round_trip_keeps_track_order(self):
+        """Test segments and vias are written back in the order they were read."""
+        board = Board.from_sexpr(parse_sexp(BOARD_SEXPR))
+        output = board.to_sexpr("kicad_pcb")
+        assert re.findall(r'\(uuid "(s1|v1|s2)"\)', output) == ["s1", "v1", "s2"]
+
+    def test_items_added_in_code_follow_parsed_items(self):
+        """Test items without a parsed position are written after the parsed ones."""
+        board = Board.from_sexpr(parse_sexp(BOARD_SEXPR))
+        # replace() goes through __init__, so the copy has no parsed position
+        board.segments.insert(0, replace(board.segments[1], uuid="s3"))
+        output = board.to_sexpr("kicad_pcb")
+        assert re.findall(r'\(uuid "(s\d|v1)"\)', output) == ["s1", "v1", "s2", "s3"]
+
+    def test_preserve_interleaved_order_is_not_serialized(self):
+        """Test the class-level setting stays out of asdict() output."""
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        assert "_preserve_interleaved_order" not in footprint.asdict()
+        assert "_preserve_interleaved_order" not in footprint.asdict()["fp_polys"][0]["pts"]
+
+
+class TestDataclassSerializerMixin:
+    """Tests for dict/JSON loading and dumping."""
+
+    def test_from_dict_builds_dataclass(self):
+        """Test from_dict builds the dataclass from matching values."""
+        assert BoundingBox.from_dict({"x": 1, "y": 2, "width": 3.5, "height": 4}) == BoundingBox(1, 2, 3.5, 4)
+
+    def test_from_dict_rejects_wrong_types(self):
+        """Test from_dict still validates primitive values."""
+        with pytest.raises(WrongTypeError):
+            BoundingBox.from_dict({"x": "abc", "y": None, "width": [], "height": {}})
+
+    def test_footprint_json_round_trip(self):
+        """Test a parsed footprint survives dumps() and from_json()."""
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        assert Footprint.from_json(footprint.dumps()) == footprint
+
+    def test_asdict_serializes_values_by_runtime_type(self):
+        """Test a value that doesn't match its field annotation is still serialized."""
+        bbox = BoundingBox(1, 2, 3, 4)
+        bbox.x = {5}
+        assert bbox.asdict() == {"x": [5], "y": 2, "width": 3, "height": 4}
+
+    def test_asdict_leaves_out_unset_fields(self):
+        """Test fields that were never set are left out instead of raising."""
+
+        @dataclass(slots=True)
+        class Partial(DataclassSerializerMixin):
+            a: int
+            b: list = field(init=False)
+
+        partial = Partial(1)
+        assert partial.asdict() == {"a": 1}
+        partial.b = [BoundingBox(0, 0, 1, 1)]
+        assert partial.asdict() == {"a": 1, "b": [{"x": 0, "y": 0, "width": 1, "height": 1}]}
+
+    def test_dumps_format(self):
+        """Test dumps() writes compact UTF-8 JSON with non-finite floats as null."""
+        assert BoundingBox(1, 2.5, float("nan"), float("inf")).dumps() == (
+            '{"x":1,"y":2.5,"width":null,"height":null}'
+        )
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR.replace("R_0603", "R_0603_Ω")))
+        assert '"name":"R_0603_Ω"' in footprint.dumps()
+
+
+class TestFootprint:
+    """Tests for footprint items and bounding boxes."""
+
+    def test_fp_item_fields_cover_every_fp_attribute(self):
+        """Test a new fp_* list can't be left out of footprint_items and the bounding box."""
+        assert tuple(f.name for f in fields(Footprint) if f.name.startswith("fp_")) == _FP_ITEM_FIELDS
+
+    def test_footprint_items_in_field_order(self):
+        """Test footprint_items returns the graphic items grouped by attribute."""
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        assert [item.uuid for item in footprint.footprint_items] == ["a1", "l1", "l2", "p1"]
+
+    def test_custom_pad_with_only_text_primitives(self):
+        """Test a custom pad without shape primitives gets an empty box at its position."""
+        footprint = Footprint.from_sexpr(parse_sexp(TEXT_ONLY_PAD_FOOTPRINT_SEXPR))
+        pad = footprint.pads[0]
+        assert pad._custom_pad_constituent_bboxes == []
+        assert pad._bounding_box == BoundingBox(1, 2, 0, 0)
+        assert footprint._bounding_box == BoundingBox(11, 22, 0, 0)
+
+    def test_serialized_bounding_box_is_verified_on_load(self):
+        """Test a footprint loaded with a bounding box that doesn't match its contents is rejected."""
+        data = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR)).asdict()
+        data["_bounding_box"]["width"] += 1
+        with pytest.raises(Exception, match="does not match the newly computed bounding box"):
+            Footprint.from_dict(data)
+
+    def test_moved_footprint_with_an_edge_at_zero_reloads(self):
+        """Test a footprint translated so its bounding box starts at 0 passes the bounding box check on load."""
+        footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        bbox = footprint._bounding_box
+        footprint.set_position(Vector2DWithRotation(footprint.at.x - bbox.x, footprint.at.y - bbox.y, footprint.at.rot))
+        assert footprint._bounding_box.x == 0
+        assert footprint._bounding_box.y == 0
+        reloaded = Footprint.from_dict(footprint.asdict())
+        assert reloaded._bounding_box == footprint._bounding_box
+
+
+class TestBoundingBox:
+    """Tests for bounding box helpers."""
+
+    def test_union_covers_every_box(self):
+        """Test union returns the box around all the boxes."""
+        boxes = [BoundingBox(0, 0, 1, 1), BoundingBox(-1, 2, 1, 3)]
+        assert BoundingBox.union(boxes) == BoundingBox(-1, 0, 2, 5)
+
+    def test_union_returns_a_new_box(self):
+        """Test union of a single box doesn't return that box."""
+        box = BoundingBox(0, 0, 1, 1)
+        result = BoundingBox.union([box])
+        assert result == box
+        assert result is not box
+
+    def test_union_of_nothing_uses_default(self):
+        """Test union of no boxes returns a copy of the default."""
+        default = BoundingBox(0, 0, 0, 0)
+        result = BoundingBox.union([], default=default)
+        assert result == default
+        assert result is not default
+
+    def test_union_of_nothing_without_default_raises(self):
+        """Test union of no boxes raises without a default."""
+        with pytest.raises(ValueError):
+            BoundingBox.union([])
+
+    @pytest.mark.parametrize("rotation", [0, 90, 180, 270, -90, 30, 123.4, -217.5])
+    @pytest.mark.parametrize("rotation_center", [None, Vector2D(0, 0), Vector2D(3.5, -1.25)])
+    def test_rotate_matches_rotating_the_corners(self, rotation, rotation_center):
+        """Test the closed-form rotation gives the box around the four rotated corners."""
+        for bbox in (BoundingBox(0, 0, 1.2, 0.5), BoundingBox(-0.45, -0.475, 0.9, 0.95), BoundingBox(2, -3, 0, 4)):
+            assert bbox.rotate(rotation, rotation_center) == _rotate_corners(bbox, rotation, rotation_center)
+
+    def test_equality_tolerates_float_noise_near_zero(self):
+        """Test boxes that only differ by float noise around 0 are equal, but real differences aren't."""
+        assert BoundingBox(5.9e-17, -1.4e-15, 1, 1) == BoundingBox(0.0, 0.0, 1, 1)
+        assert BoundingBox(1e-6, 0, 1, 1) != BoundingBox(0, 0, 1, 1)
+
+
+class TestBoard:
+    """Tests for board footprint helpers."""
+
+    def _board_with_footprints(self, *uuids: str) -> Board:
+        board = Board.from_sexpr(parse_sexp(BOARD_SEXPR))
+        for uuid in uuids:
+            footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+            footprint.uuid = uuid
+            board.footprints.append(footprint)
+        return board
+
+    def test_replace_footprint_by_uuid(self):
+        """Test replace_footprint swaps in the footprint with the same uuid."""
+        board = self._board_with_footprints("a", "b")
+        new_footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        new_footprint.uuid = "b"
+        assert board.replace_footprint(new_footprint) is True
+        assert board.footprints[1] is new_footprint
+        missing_footprint = Footprint.from_sexpr(parse_sexp(FOOTPRINT_SEXPR))
+        missing_footprint.uuid = "missing"
+        assert board.replace_footprint(missing_footprint) is False
+
+
+class TestSchematic:
+    """Tests for schematic lib symbol lookups."""
+
+    def test_find_symbol_instance_parent_uses_first_duplicate(self):
+        """Test the first lib symbol with a duplicated name is the parent."""
+        schematic = Schematic.from_sexpr_string(DUPLICATE_LIB_SYMBOL_SCHEMATIC)
+        parent = schematic.find_symbol_instance_parent(schematic.symbols[0])
+        assert parent.get_property("Value") == "first"
+
+    def test_all_pin_locs_uses_first_duplicate(self):
+        """Test pin locations come from the same lib symbol as find_symbol_instance_parent."""
+        schematic = Schematic.from_sexpr_string(DUPLICATE_LIB_SYMBOL_SCHEMATIC)
+        assert [pin_loc.pin.name.name for pin_loc in schematic._all_pin_locs()] == ["A"]
@@ -1,5 +1,7 @@
 """Tests for CLI commands module."""
 
+from unittest.mock import patch
+
 import click
 from click.testing import CliRunner
 
@@ -164,3 +166,26 @@ class TestCleanupCommand:
         runner = CliRunner()
         result = runner.invoke(cleanup, ["--dry-run", "--days", "7"])
         assert result.exit_code == 0
+
+
+class TestServerRun:
+    """Tests for the server run command."""
+
+    @patch("uvicorn.run")
+    def test_server_run_defaults_to_one_worker(self, mock_run, monkeypatch):
+        """Test server run starts a single worker unless asked for more."""
+        from cli.commands import server_run
+
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        result = CliRunner().invoke(server_run, [])
+        assert result.exit_code == 0
+        assert mock_run.call_args.kwargs["workers"] == 1
+
+    @patch("uvicorn.run")
+    def test_server_run_reads_workers_from_web_concurrency(self, mock_run):
+        """Test server run takes the worker count from WEB_CONCURRENCY."""
+        from cli.commands import server_run
+
+        result = CliRunner().invoke(server_run, [], env={"WEB_CONCURRENCY": "4"})
+        assert result.exit_code == 0
+        assert mock_run.call_args.kwargs["workers"] == 4
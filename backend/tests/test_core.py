@@ -30,6 +30,18 @@ class TestSettings:
         """Test CORS origins is a list."""
         assert isinstance(settings.CORS_ORIGINS, list)
 
+    def test_db_pool_recycles_connections(self):
+        """Test pooled connections are recycled and pre-pinged."""
+        assert settings.DB_POOL_RECYCLE > 0
+        assert settings.DB_POOL_PRE_PING is True
+
+    def test_engine_pool_uses_recycle_and_pre_ping_settings(self):
+        """Test the database engine's pool is created with the recycle and pre-ping settings."""
+        from app.db.session import engine
+
+        assert engine.pool._recycle == settings.DB_POOL_RECYCLE
+        assert engine.pool._pre_ping is settings.DB_POOL_PRE_PING
+
 
 class TestExceptions:
     """Tests for custom exceptions."""
@@ -109,6 +121,7 @@ from unittest.mock import patch  # noqa: E402
 class TestLogfireSetup:
     """Tests for Logfire setup."""
 
+    @patch("app.core.logfire_setup._configured", False)
     @patch("app.core.logfire_setup.logfire")
     def test_setup_logfire_configures(self, mock_logfire):
         """Test setup_logfire calls configure."""
@@ -117,6 +130,16 @@ class TestLogfireSetup:
         setup_logfire()
         mock_logfire.configure.assert_called_once()
 
+    @patch("app.core.logfire_setup._configured", False)
+    @patch("app.core.logfire_setup.logfire")
+    def test_setup_logfire_is_idempotent(self, mock_logfire):
+        """Test repeated setup_logfire calls configure only once."""
+        from app.core.logfire_setup import setup_logfire
+
+        setup_logfire()
+        setup_logfire()
+        mock_logfire.configure.assert_called_once()
+
     @patch("app.core.logfire_setup.logfire")
     def test_instrument_app_instruments_fastapi(self, mock_logfire):
         """Test instrument_app instruments FastAPI."""